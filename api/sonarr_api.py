@@ -3,46 +3,69 @@ Sonarr API client for checking existing episodes
 """
 
 import os
+import functools
 import logging
 import requests
 import re
 import time
+from collections import OrderedDict, defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# How long the full series list is reused before it is fetched again
+SERIES_CACHE_TTL = 60
+
+# Maximum number of release lookups remembered by find_matching_release
+RELEASE_CACHE_SIZE = 256
+
+# Longest wait in seconds between two retries of a Sonarr request
+RETRY_BACKOFF_MAX = 30
+
+# Characters Sonarr ignores when comparing titles (anything but word chars and whitespace)
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
 
 def normalize_title(title):
     """Normalize series title to match Sonarr's storage format"""
     if not title:
         return title
-    # Remove extra spaces and normalize
-    title = re.sub(r'\s+', ' ', title.strip())
+    # Remove extra spaces and normalize (split() collapses any whitespace run)
+    title = ' '.join(title.split())
     # Remove special characters that Sonarr might ignore
-    title = re.sub(r'[^\w\s]', '', title)
-    return title
+    return _PUNCT_RE.sub('', title)
 
 
-def retry_api_call(max_retries=3, delay=1):
-    """Decorator for retrying API calls with exponential backoff"""
-    def decorator(func):
-        def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    if attempt == max_retries - 1:
-                        raise e
-                    logger.warning(f"API call failed (attempt {attempt + 1}/{max_retries}): {e}")
-                    time.sleep(delay * (2 ** attempt))
-        return wrapper
-    return decorator
+@functools.lru_cache(maxsize=1024)
+def _title_key(title):
+    """Lookup key for a series title, memoized so each title is normalized only once"""
+    return normalize_title(title).lower()
+
+
+class ExistingEpisodes(set):
+    """Set of existing episode codes (S01E01 format) with an integer index by season"""
+
+    def __init__(self, episodes=()):
+        """Build from (season_number, episode_number) pairs"""
+        pairs = set(episodes)
+        super().__init__(f"S{season:02d}E{episode:02d}" for season, episode in pairs)
+        by_season = defaultdict(set)
+        for season, episode in pairs:
+            by_season[season].add(episode)
+        self.by_season = {season: frozenset(numbers) for season, numbers in by_season.items()}
+
+    def has_episode(self, season, episode):
+        """Check whether an episode exists without formatting an episode code"""
+        return episode in self.by_season.get(season, ())
 
 
 class SonarrAPI:
     """Sonarr API client for checking existing episodes"""
 
+    __slots__ = ('base_url', 'api_key', 'session', '_series_cache', '_series_cache_ts',
+                 '_series_ttl', '_series_index', '_release_cache')
+
     def __init__(self, base_url=None, api_key=None):
         raw_url = base_url or os.environ.get('sonarr_applicationurl', '')
         self.base_url = raw_url.rstrip('/') if raw_url else ''
@@ -50,52 +73,91 @@ class SonarrAPI:
         self.session = requests.Session()
         self.session.headers.update({'X-Api-Key': self.api_key})
 
-    def get_series_episodes(self, series_id):
-        """Get all episodes for a series"""
+        # Let urllib3 retry transient failures and keep connections to Sonarr alive; only idempotent
+        # reads on throttling or server errors are retried, with the backoff capped and jittered
+        # so parallel lookups do not retry in lockstep
+        retry = Retry(total=3, backoff_factor=0.5, backoff_max=RETRY_BACKOFF_MAX, backoff_jitter=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504], allowed_methods={'GET'})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        # Series list cache (refreshed every SERIES_CACHE_TTL seconds)
+        self._series_cache = None
+        self._series_cache_ts = 0
+        self._series_ttl = SERIES_CACHE_TTL
+        self._series_index = {}
+
+        # Thread URLs already found by find_matching_release (LRU, successes only)
+        self._release_cache = OrderedDict()
+
+    def invalidate(self):
+        """Clear all cached Sonarr data and release lookups"""
+        self.invalidate_series_cache()
+        self._release_cache.clear()
+
+    def get_series_episodes(self, series_id, season_number=None):
+        """Get all episodes for a series, optionally limited to one season"""
         url = f"{self.base_url}/api/v3/episode"
         params = {'seriesId': series_id}
-        for attempt in range(3):
-            try:
-                response = self.session.get(url, params=params)
-                response.raise_for_status()
-                episodes = response.json()
-                logger.debug(f"Retrieved {len(episodes)} episodes for series {series_id}")
-                logger.debug(f"Episodes sample: {episodes[:3] if episodes else 'None'}")
-                return episodes
-            except requests.exceptions.RequestException as e:
-                if attempt == 2:
-                    logger.warning(f"Failed to get episodes from Sonarr after retries: {e}")
-                    return []
-                logger.warning(f"API call failed (attempt {attempt + 1}/3): {e}")
-                time.sleep(1 * (2 ** attempt))
-        return []
+        if season_number is not None:
+            params['seasonNumber'] = season_number
+        try:
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            episodes = response.json()
+            logger.debug(f"Retrieved {len(episodes)} episodes for series {series_id}")
+            logger.debug(f"Episodes sample: {episodes[:3] if episodes else 'None'}")
+            return episodes
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to get episodes from Sonarr: {e}")
+            return []
+
+    def invalidate_series_cache(self):
+        """Drop the cached series list so the next lookup fetches it again"""
+        self._series_cache = None
+        self._series_cache_ts = 0
+        self._series_index = {}
+
+    def _get_series_index(self):
+        """Get the series index keyed by normalized lowercase title, using the cache while fresh"""
+        if self._series_cache is not None and time.monotonic() - self._series_cache_ts < self._series_ttl:
+            logger.debug(f"Using cached series list ({len(self._series_cache)} series)")
+            return self._series_index
+
+        url = f"{self.base_url}/api/v3/series"
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            series_list = response.json()
+            logger.debug(f"Retrieved {len(series_list)} series from Sonarr")
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Failed to get series from Sonarr: {e}")
+            self.invalidate_series_cache()
+            return None
+
+        # Keep the first series for each normalized title, like the old linear scan did
+        series_index = {}
+        for series in series_list:
+            series_index.setdefault(_title_key(series['title']), series)
+
+        self._series_cache = series_list
+        self._series_cache_ts = time.monotonic()
+        self._series_index = series_index
+        return series_index
 
     def get_series_by_title(self, title):
         """Find series by title"""
-        normalized_title = normalize_title(title)
-        url = f"{self.base_url}/api/v3/series"
-        for attempt in range(3):
-            try:
-                response = self.session.get(url)
-                response.raise_for_status()
-                series_list = response.json()
-                logger.debug(f"Retrieved {len(series_list)} series from Sonarr")
-
-                # Find series with matching normalized title
-                for series in series_list:
-                    series_normalized = normalize_title(series['title'])
-                    if series_normalized.lower() == normalized_title.lower():
-                        logger.info(f"Found matching series: '{series['title']}' for input '{title}'")
-                        return series
-                logger.warning(f"Series '{title}' (normalized: '{normalized_title}') not found in Sonarr")
-                logger.debug(f"Available series titles: {[s['title'] for s in series_list[:5]]}")
-                return None
-            except requests.exceptions.RequestException as e:
-                if attempt == 2:
-                    logger.warning(f"Failed to get series from Sonarr after retries: {e}")
-                    return None
-                logger.warning(f"API call failed (attempt {attempt + 1}/3): {e}")
-                time.sleep(1 * (2 ** attempt))
+        series_index = self._get_series_index()
+        if series_index is None:
+            return None
+
+        series = series_index.get(_title_key(title))
+        if series:
+            logger.info(f"Found matching series: '{series['title']}' for input '{title}'")
+            return series
+        logger.warning(f"Series '{title}' (normalized: '{normalize_title(title)}') not found in Sonarr")
+        logger.debug(f"Available series titles: {[s['title'] for s in self._series_cache[:5]]}")
         return None
 
     def find_matching_release(self, extractor, release_title, series_title=None, season=None, episode=None):
@@ -104,6 +166,22 @@ class SonarrAPI:
             logger.warning("Missing extractor or release_title for find_matching_release")
             return None
 
+        cache_key = (type(extractor).__name__, release_title, series_title, season, episode)
+        thread_url = self._release_cache.get(cache_key)
+        if thread_url:
+            self._release_cache.move_to_end(cache_key)
+            logger.info(f"Using cached thread for release: {release_title}")
+            return thread_url
+
+        thread_url = self._search_release(extractor, release_title, series_title, season, episode)
+        if thread_url:
+            self._release_cache[cache_key] = thread_url
+            if len(self._release_cache) > RELEASE_CACHE_SIZE:
+                self._release_cache.popitem(last=False)
+        return thread_url
+
+    def _search_release(self, extractor, release_title, series_title, season, episode):
+        """Run the extractor search methods and return the best thread URL"""
         try:
             logger.info(f"Finding matching release for: {release_title}")
             if series_title:
@@ -113,37 +191,41 @@ class SonarrAPI:
             if episode:
                 logger.debug(f"Episode context: {episode}")
 
-            # Try enhanced metadata-aware search first
+            # Collect the available search methods in priority order
+            searches = []
             enhanced_search_method = getattr(extractor, 'search_thread_by_release_title_with_metadata', None)
             if enhanced_search_method and (series_title or season or episode):
-                logger.info("Using enhanced metadata-aware search")
-                thread_url = enhanced_search_method(
+                searches.append(("Enhanced", functools.partial(
+                    enhanced_search_method,
                     release_title=release_title,
                     series_title=series_title,
                     season=season,
                     episode=episode
-                )
-                if thread_url:
-                    logger.info("Enhanced search successful")
-                    return thread_url
-
-            # Fallback to standard search
-            logger.info("Enhanced search failed or insufficient metadata, using standard search")
+                )))
             fallback_method = getattr(extractor, 'search_thread_by_release_title', None)
             if fallback_method:
-                thread_url = fallback_method(release_title)
-                if thread_url:
-                    logger.info("Standard search successful")
-                    return thread_url
-
-            # Last resort: use new search_thread method with caching
-            logger.info("Standard search failed, using cached search_thread method")
+                searches.append(("Standard", functools.partial(fallback_method, release_title)))
             search_thread_method = getattr(extractor, 'search_thread', None)
             if search_thread_method:
-                thread_url = search_thread_method(release_title)
+                searches.append(("Cached", functools.partial(search_thread_method, release_title)))
+
+            if not searches:
+                logger.warning("Extractor provides no search methods")
+                return None
+
+            # Fall back only when the previous search misses. Search methods and query strategies
+            # both run in priority order; the only overlap is the extractor's bounded one-query
+            # prefetch, which is skipped once a higher-priority query hits
+            for name, search in searches:
+                try:
+                    thread_url = search()
+                except Exception as e:
+                    logger.warning(f"{name} search raised an error: {e}")
+                    continue
                 if thread_url:
-                    logger.info("Cached search successful")
+                    logger.info(f"{name} search successful")
                     return thread_url
+                logger.info(f"{name} search found nothing")
 
             logger.warning("All search methods failed to find matching release")
             return None
@@ -153,8 +235,8 @@ class SonarrAPI:
             return None
 
     def get_existing_episodes(self, series_title, season_number=None):
-        """Get list of existing episode codes (S01E01 format)"""
-        existing_episodes = set()
+        """Get existing episode codes (S01E01 format), also indexed by season via by_season"""
+        existing_episodes = ExistingEpisodes()
 
         try:
             series = self.get_series_by_title(series_title)
@@ -162,20 +244,26 @@ class SonarrAPI:
                 logger.warning(f"Series '{series_title}' not found in Sonarr")
                 return existing_episodes
 
-            episodes = self.get_series_episodes(series['id'])
-            file_count = 0
-            total_episodes = len(episodes)
-            for episode in episodes:
-                has_file = episode.get('hasFile', False)
-                season_num = episode.get('seasonNumber', 0)
-                episode_num = episode.get('episodeNumber', 0)
-                if has_file:
-                    episode_code = f"S{season_num:02d}E{episode_num:02d}"
-                    existing_episodes.add(episode_code)
-                    file_count += 1
-                    logger.debug(f"Existing episode: {episode_code} (season {season_num}, ep {episode_num})")
-
-            logger.info(f"Sonarr API check complete: {file_count} episodes with files out of {total_episodes} total episodes")
+            season_filter = int(season_number) if season_number not in (None, '') else None
+            episodes = self.get_series_episodes(series['id'], season_filter)
+            try:
+                # Sonarr normally sends every field, so the hot loop indexes them directly
+                existing_episodes = ExistingEpisodes(
+                    (episode['seasonNumber'], episode['episodeNumber'])
+                    for episode in episodes
+                    if episode['hasFile']
+                    and (season_filter is None or episode['seasonNumber'] == season_filter)
+                )
+            except KeyError:
+                # Any record without one of the fields falls back to defaults for all of them
+                existing_episodes = ExistingEpisodes(
+                    (episode.get('seasonNumber', 0), episode.get('episodeNumber', 0))
+                    for episode in episodes
+                    if episode.get('hasFile', False)
+                    and (season_filter is None or episode.get('seasonNumber', 0) == season_filter)
+                )
+
+            logger.info(f"Sonarr API check complete: {len(existing_episodes)} episodes with files out of {len(episodes)} total episodes")
             if existing_episodes:
                 logger.info(f"Existing episodes: {sorted(existing_episodes)}")
             else:
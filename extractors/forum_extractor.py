@@ -7,8 +7,10 @@ This module defines the abstract interface for forum extractor implementations.
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Any
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from torrents.torrent_client import TorrentClient
 
 
@@ -31,13 +33,12 @@ class ForumExtractor(ABC):
         self.session = None  # Will be set by concrete implementations
 
     @abstractmethod
-    def login(self, retries: int = 15, initial_wait: int = 5) -> bool:
+    def login(self, retries: int = 3) -> bool:
         """
         Login to the forum site.
 
         Args:
-            retries (int): Number of login retry attempts
-            initial_wait (int): Initial wait time between retries
+            retries (int): Number of login attempts; transport-level retries are left to the session
 
         Returns:
             bool: True if login successful, False otherwise
@@ -135,4 +136,19 @@ class ForumExtractor(ABC):
         Returns:
             set: Set of needed episode codes
         """
-        pass
\ No newline at end of file
+        pass
+    def close(self) -> None:
+        """
+        Persist pending state and release resources held by the extractor.
+
+        The default implementation does nothing; extractors that buffer
+        state (cookies, caches) override it to flush that state.
+        """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
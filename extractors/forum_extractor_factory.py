@@ -4,10 +4,15 @@ Forum Extractor Factory
 Factory module for creating forum extractor instances based on configuration.
 """
 
+import atexit
+import functools
 from typing import Optional
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from extractors.forum_extractor import ForumExtractor
 from extractors.mircrew_extractor import MIRCrewExtractor
 from torrents.torrent_client_factory import create_torrent_client
@@ -17,6 +22,9 @@ def create_forum_extractor(forum_type: Optional[str] = None) -> ForumExtractor:
     """
     Factory function to create forum extractor instances.
 
+    Instances are cached per forum type, so repeated calls share the same
+    extractor (and its HTTP session and torrent client).
+
     Args:
         forum_type (str, optional): Type of forum extractor to create.
                                    If None, reads from FORUM_TYPE env var.
@@ -29,13 +37,36 @@ def create_forum_extractor(forum_type: Optional[str] = None) -> ForumExtractor:
         ValueError: If unsupported forum type is requested
     """
     if forum_type is None:
-        forum_type = os.environ.get('FORUM_TYPE', 'mircrew').lower()
+        forum_type = os.environ.get('FORUM_TYPE', 'mircrew')
+
+    return _create_cached_forum_extractor(forum_type.lower())
+
+
+@functools.lru_cache(maxsize=4)
+def _create_cached_forum_extractor(forum_type: str) -> ForumExtractor:
+    """
+    Create the forum extractor for a normalized forum type, once per type.
+
+    The cached instance outlives any single caller, so its close() is
+    registered to run at interpreter exit to persist buffered state.
+
+    Args:
+        forum_type (str): Lowercase forum type
+
+    Returns:
+        ForumExtractor: Cached instance of the requested forum extractor
 
+    Raises:
+        ValueError: If unsupported forum type is requested
+    """
     if forum_type == 'mircrew':
-        return _create_mircrew_extractor()
+        extractor = _create_mircrew_extractor()
     else:
         raise ValueError(f"Unsupported forum type: {forum_type}")
 
+    atexit.register(extractor.close)
+    return extractor
+
 
 def _create_mircrew_extractor() -> MIRCrewExtractor:
     """
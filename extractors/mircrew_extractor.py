@@ -4,20 +4,29 @@ MIRCrew Forum Extractor Implementation
 Concrete implementation of ForumExtractor for MIRCrew forum.
 """
 
+import functools
 import re
 import requests
 import time
-import random
 import logging
+import threading
 import pickle
-from bs4 import BeautifulSoup, Tag
-from urllib.parse import urljoin, parse_qs, urlparse, unquote, quote_plus
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from urllib.parse import urljoin, unquote_plus, quote_plus
 import sys
 import os
+from pathlib import Path
 import yaml
-from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
 from typing import Optional, List, Dict
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from extractors.forum_extractor import ForumExtractor
 from torrents.torrent_client import TorrentClient
 
@@ -29,8 +38,152 @@ MIRCREW_BASE_URL = str(os.environ.get('MIRCREW_BASE_URL', 'https://mircrew-relea
 MIRCREW_USERNAME = str(os.environ.get('MIRCREW_USERNAME'))
 MIRCREW_PASSWORD = str(os.environ.get('MIRCREW_PASSWORD'))
 
-# Cookie persistence
+# Title-only topic search in the TV forums (28, 51, 52, 30); {query} must already be URL-encoded
+SEARCH_URL_TEMPLATE = (
+    f"{MIRCREW_BASE_URL}search.php?keywords={{query}}&terms=all&author="
+    "&fid%5B%5D=28&fid%5B%5D=51&fid%5B%5D=52&fid%5B%5D=30"
+    "&sc=1&sf=titleonly&sr=topics&sk=t&sd=d&st=0&ch=300&t=0&submit=Cerca"
+)
+
+# (connect, read) timeout for forum requests: fail fast on dead hosts, allow slow pages
+REQUEST_TIMEOUT = (5, 30)
+
+# Number of lower-priority searches started ahead while the current one is awaited
+SEARCH_PREFETCH = 1
+
+# Forum search results reused within a run: (seconds, entries)
+SEARCH_CACHE_TTL = 600
+SEARCH_CACHE_SIZE = 256
+
+# Threads confirmed to exist are trusted for this many seconds before being checked again
+THREAD_VERIFY_TTL = 600
+
+# A verified or freshly logged in session is trusted for this many seconds, so the searches
+# that follow main's check do not each repeat it; a search served the login form resets it
+SESSION_VERIFY_TTL = 300
+
+# Cookie and thread cache persistence, relative to the working directory
 COOKIE_FILE = "mircrew_cookies.pkl"
+CACHE_FILE = "mircrew_cache.yml"
+
+# Thread cache entries older than this many seconds (6 months) are expired
+CACHE_ENTRY_MAX_AGE = 180 * 86400
+
+# Thread cache writes are batched: flush after this many changes or this many seconds
+CACHE_FLUSH_BATCH = 10
+CACHE_FLUSH_INTERVAL = 30
+
+# Precompiled patterns for release title cleanup and thread URLs
+_VIDEO_EXT_RE = re.compile(r'\.(mkv|mp4|avi|m4v|mov)$', re.IGNORECASE)
+# File extension, quality tags and trailing release group, stripped in one pass
+# (the group may sit just before the extension, which the same pass removes)
+_RELEASE_NOISE_RE = re.compile(
+    r'\.(?:mkv|mp4|avi|m4v|mov)$'
+    r'|\b(?:1080p|720p|2160p|4K|UHD|BluRay|WEB-DL|HDTV)\b'
+    r'|-\w+(?=(?:\.(?:mkv|mp4|avi|m4v|mov))?$)',
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+# t=12345 as a query parameter (viewtopic.php?f=52&t=12345) or on its own, but not st=0
+_THREAD_ID_RE = re.compile(r'(?:^|[?&])t=(\d+)')
+_MAGNET_DN_RE = re.compile(r'[?&]dn=([^&#]+)')
+
+# Precompiled patterns for parsing release titles into series name and metadata
+_BRACKET_TAG_RE = re.compile(r'\s*\[.*?\]')  # [IN CORSO], [03/10], etc.
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+_MULTI_EPISODE_RE = re.compile(
+    r"(.*?)(?:\s+S\d+E\d+[-~]S?\d*E\d+.*|\s+S\d+E\d+E\d+.*|\s+S\d+E\d+-\d+.*|\s+S\d+E\d+~\d+.*)",
+    re.IGNORECASE
+)
+_SERIES_SUFFIX_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'\s*-\s*S\d+E\d+(?:\s*of\s*\d+)?(?:\s*-\s*\d+)?(?:\s*\[.*?\])?.*$',
+    r'\s*-\s*Stagione\s*\d+(?:\s*\[.*?\])?.*$',
+    r'\s*-\s*Season\s*\d+(?:\s*\[.*?\])?.*$',
+    r'\s+(\d+)(?:st|nd|rd|th)\s+Season(?:\s+Episode\s+\d+)?.*$',
+    r'\s+Season\s+\d+\s+Ep(?:\.|\s)?\s*\d+.*$',
+    r'\s+Stagione\s+\d+\s+Ep(?:\.|\s)?\s*\d+.*$',
+    r'\s+\d+x\d+(?:-\d+)?(?:\s*\[.*?\])?.*$',
+    r'\s+S\d+E\d+(?:\s*of\s*\d+)?(?:\s*\[.*?\])?.*$',
+    r'\s*\d+x\d+(?:\s*of\s*\d+)?(?:.*)?$',
+    r'\s+Season\s*\d+(?:\s*\[.*?\])?.*$',  # Season 2 without dash
+    r'\s+Stagione\s*\d+(?:\s*\[.*?\])?.*$',  # Stagione 2 without dash
+)]
+_TRAILING_DASHES_RE = re.compile(r'[-\s]+$')
+# Release metadata patterns per field, most specific first; each field takes the first pattern
+# that matches anywhere in the title. They are searched separately rather than fused, since a
+# fused scan lets an earlier match consume text a higher-priority pattern needs
+# (e.g. "2nd Season 720p" must yield season 720 from "Season 720", not 2 from "2nd Season")
+_META_PATTERNS = {field: [re.compile(pattern, re.IGNORECASE) for pattern in patterns] for field, patterns in {
+    'resolution': (r'\b(1080p|720p|2160p|4K|UHD)\b', r'\b(\d{3,4}p)\b'),
+    'codec': (r'\b(H264|H265|x264|x265|AVC|HEVC)\b', r'\b(XviD|DivX)\b'),
+    'year': (r'\b((?:19|20)\d{2})\b',),
+    'season': (r'S(\d+)', r'Stagione\s*(\d+)', r'Season\s*(\d+)',
+               r'(\d+)(?:st|nd|rd|th)\s+Season', r'(\d+)x\d+'),
+}.items()}
+
+# Episode patterns for magnet context, most specific first, with the code each one yields.
+# Each is searched on its own: merged into one alternation, a broader pattern could consume
+# the text a more specific one needs (e.g. "Ep" in "Ep.2x03"), since matches never overlap
+_EPISODE_INFO_PATTERNS = [(kind, re.compile(pattern, re.IGNORECASE)) for kind, pattern in (
+    ('episode', r'S(\d+)E(\d+)(?:\s*of\s*\d+)?'),  # S5E04, S5E04 of 10
+    ('episode', r'(\d+)x(\d+)(?:-\d+)?'),          # 5x04, 5x04-10
+    ('episode', r'(\d+)(?:st|nd|rd|th)\s+Season\s+Episode\s+(\d+)'),  # 5th Season Episode 3
+    ('episode', r'Season\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)'),  # Season 2 Ep 5
+    ('episode', r'Stagione\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)'),  # Stagione 2 Ep 5
+    ('season', r'Stagione\s*(\d+)'),               # Stagione 5
+    ('season', r'Season\s*(\d+)'),                 # Season 5
+    ('season', r'(\d+)(?:st|nd|rd|th)\s+Season'),  # 5th Season
+    ('single', r'(?:^|[^S]\b)Ep\.?\s*(\d+)(?:-(\d+))?'),      # Ep 7, Ep 7-10
+    ('single', r'(?:^|[^S]\b)Episodio\s+(\d+)(?:\s*-\s*(\d+))?'),  # Episodio 7, Episodio 7-10
+    ('single', r'Episode\s+(\d+)'),               # Episode 7
+    ('single', r'Ep\s+(\d+)'),                    # Ep 7 (alternative)
+)]
+_SEASON_CONTEXT_RE = re.compile(r'S(?:tagione|eason)?\s*(\d+)', re.IGNORECASE)
+_EPISODE_CODE_RE = re.compile(r"S\d{2}E\d{2}", re.IGNORECASE)
+# Episode ranges in Sonarr paths: S01E01, S01E01-E03, 1x01, 1x01-03
+_NEEDED_EPISODE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'S(\d+)E(\d+)(?:-E(\d+))?',
+    r'(\d+)x(\d+)(?:-(\d+))?',
+)]
+
+# Magnet anchors on thread pages (strict hex hashes) and in legacy posts (looser hashes)
+_MAGNET_HREF_RE = re.compile(r'magnet:\?xt=urn:(?:btih|ed2k):[a-fA-F0-9]{32,64}', re.IGNORECASE)
+_LEGACY_MAGNET_RE = re.compile(r'magnet:\?xt=urn:(?:btih|ed2k):[a-zA-Z0-9]{8,64}(?:&.*)?')
+# Hash of a magnet's exact topic, the identity of the torrent whatever trackers are listed
+_MAGNET_XT_RE = re.compile(r'xt=urn:(?:btih|ed2k):([a-zA-Z0-9]{8,64})')
+
+# Precompiled patterns for checking login state on forum pages
+_LOGIN_FAILED_RE = re.compile(r'login.*failed|invalid.*credentials|wrong.*password|access.*denied', re.IGNORECASE)
+_ERROR_CLASS_RE = re.compile(r'error|alert')
+_LOGIN_TEXT_RE = re.compile(r'login|password', re.IGNORECASE)
+_MODE_LOGOUT_RE = re.compile(r'mode=logout')
+_LOGOUT_HREF_RE = re.compile(r'logout')
+_LOGOUT_TEXT_RE = re.compile(r'logout|esci|log out', re.IGNORECASE)
+_WELCOME_RE = re.compile(r'welcome.*back|benvenuto|logged.*in', re.IGNORECASE)
+_USER_PANEL_RE = re.compile(r'user.*panel|welcome')
+_PAGE_ERROR_RE = re.compile(r'error|failed|wrong|invalid', re.IGNORECASE)
+
+# Raw-HTML checks used when a page only needs a yes/no login answer, without building a soup
+_LOGIN_FORM_HTML_RE = re.compile(r'<form[^>]*\bid=["\']login["\']', re.IGNORECASE)
+_LOGOUT_LINK_HTML_RE = re.compile(r'href=["\'][^"\']*logout', re.IGNORECASE)
+
+# Parse forum pages with lxml's C parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Search result pages only need the topic list, so only that subtree is built
+_SEARCH_RESULTS_STRAINER = SoupStrainer('ul', class_='topiclist topics')
+# Likewise the login page is only read for its login form
+_LOGIN_FORM_STRAINER = SoupStrainer('form', id='login')
+
+# Use libyaml's C loader/dumper for the thread cache when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
 
 # Validate required MIRCrew environment variables
 if not MIRCREW_USERNAME or not MIRCREW_PASSWORD:
@@ -41,15 +194,101 @@ assert MIRCREW_USERNAME is not None
 assert MIRCREW_PASSWORD is not None
 
 
+def _entry_timestamp(entry):
+    """Epoch seconds of a thread cache entry, parsing the ISO timestamp only when 'ts' is missing"""
+    ts = entry.get('ts')
+    if ts is None:
+        ts = datetime.fromisoformat(entry['timestamp']).timestamp()
+    return ts
+
+
+def _entry_age_key(item):
+    """Sort key placing thread cache entries oldest first (legacy and malformed entries first)"""
+    try:
+        return _entry_timestamp(item[1])
+    except (AttributeError, TypeError, KeyError, ValueError):
+        return float('-inf')
+
+
+def _response_html(response):
+    """Decoded page body, assuming UTF-8 when the server sends no charset instead of sniffing it"""
+    # requests falls back to ISO-8859-1 for any text/* response without a charset, so
+    # the header itself is checked rather than response.encoding
+    if 'charset' not in response.headers.get('Content-Type', '').lower():
+        response.encoding = 'utf-8'
+    return response.text
+
+
+# Release titles are parsed once each: the search strategies, the season query and the
+# cache lookup all ask for the same title's series name and metadata
+@functools.lru_cache(maxsize=512)
+def _parse_base_series_name(release_title):
+    """Series name of a release title without season/episode metadata, or None if too short"""
+    title = release_title.strip()
+
+    # Remove common suffixes and metadata
+    title = _BRACKET_TAG_RE.sub('', title)  # Remove [IN CORSO], [03/10], etc.
+    title = _TRAILING_PARENS_RE.sub('', title)  # Remove trailing parentheses
+
+    # Handle multi-episode ranges first
+    match = _MULTI_EPISODE_RE.match(title)
+    if match:
+        return match.group(1).strip()
+
+    # Look for season patterns and extract series name
+    series_name = title
+    for pattern in _SERIES_SUFFIX_PATTERNS:
+        match = pattern.search(series_name)
+        if match:
+            series_name = series_name[:match.start()].strip()
+            break
+
+    # Clean up series name
+    series_name = _TRAILING_DASHES_RE.sub('', series_name)  # Trailing dashes/spaces
+
+    # Validate series name
+    if len(series_name) >= 2:
+        return series_name
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_release_meta(release_title):
+    """Resolution, codec, year and season of a release title, parsed once per title (shared, do not mutate)"""
+    meta = {}
+    for field, patterns in _META_PATTERNS.items():
+        meta[field] = None
+        for pattern in patterns:
+            match = pattern.search(release_title)
+            if match:
+                meta[field] = match.group(1)
+                break
+    return meta
+
+
+@functools.lru_cache(maxsize=4096)
+def _thread_cache_key(series_title, season):
+    """Thread cache key for a series and season (S01 style when numeric), built once and interned"""
+    try:
+        return sys.intern(f"{series_title} S{int(season):02d}")
+    except (ValueError, TypeError):
+        return sys.intern(f"{series_title} S{season}")
+
+
+def _magnet_key(magnet_url):
+    """Dedup key for a magnet: its lowercased info hash, or the URL itself when it has none"""
+    match = _MAGNET_XT_RE.search(magnet_url)
+    return match.group(1).lower() if match else magnet_url
+
+
 def extract_magnet_title_from_url(magnet_url):
     """Extracts the speaking title from the dn parameter of the magnet link"""
-    parsed = urlparse(magnet_url)
-    params = parse_qs(parsed.query)
-    dn_list = params.get('dn', [])
-    if dn_list:
-        title = unquote(dn_list[0])
+    # Pull the first non-empty dn value straight from the URI instead of parsing every parameter
+    match = _MAGNET_DN_RE.search(magnet_url)
+    if match:
+        title = unquote_plus(match.group(1))
         # Remove common file extensions (.mkv, .mp4, .avi, .m4v, .mov)
-        title = re.sub(r'\.(mkv|mp4|avi|m4v|mov)$', '', title, flags=re.IGNORECASE)
+        title = _VIDEO_EXT_RE.sub('', title)
         return title
     return ''
 
@@ -61,39 +300,92 @@ class MIRCrewExtractor(ForumExtractor):
         super().__init__(torrent_client)
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept': 'text/html,application/xhtml+xml',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive'
         })
 
+        # Let urllib3 retry transient failures (honouring Retry-After) on pooled keep-alive connections;
+        # the jitter spreads out the retries of concurrent searches hitting the same outage
+        retry = Retry(total=3, backoff_factor=0.5, backoff_jitter=0.5, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods={'GET', 'POST'}, respect_retry_after_header=True)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # Thread ID cache attributes
-        self.cache_file = "mircrew_cache.yml"
+        self.cookie_file = COOKIE_FILE
+        self.cache_file = CACHE_FILE
         self.thread_id_cache = {}
         self.cache_loaded = False
 
         # Cache metrics
         self.cache_hits = 0
         self.cache_misses = 0
-        self.cache_last_metrics_log = None
+        self.cache_last_metrics_log = None  # time.monotonic() of the last metrics log
         self.cache_max_size = 100
 
+        # Fingerprint of the cookies last loaded from or saved to the cookie file
+        # (starts as the empty jar's, so an unused session never writes the file)
+        self._cookie_hash = self._cookie_fingerprint()
+
+        # Session ID cookie value from the last successful login check
+        self._sid = None
+
+        # Configured username as shown on logged-in pages; an empty pattern would match every page
+        username = MIRCREW_USERNAME.strip()
+        self._username_re = re.compile(re.escape(username), re.IGNORECASE) if username and username != 'None' else None
+
+        # In-memory search results (LRU with TTL, successes only) and threads known to exist
+        self._search_cache = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._verified_thread_ids = {}
+        self._session_verified_at = None
+
+        # Unsaved cache changes, written in batches by _maybe_flush_cache
+        self._cache_dirty = 0
+        self._last_flush = time.monotonic()
+
         self.load_cookies()
         self.load_cache()
 
+    def _cookie_fingerprint(self):
+        """Hash of the session cookies, used to detect whether they changed"""
+        return hash(tuple(sorted((c.name, c.value or '', c.domain) for c in self.session.cookies)))
+
     def load_cookies(self):
         """Load saved cookies from file"""
         try:
-            if os.path.exists(COOKIE_FILE):
-                with open(COOKIE_FILE, 'rb') as f:
+            if os.path.exists(self.cookie_file):
+                with open(self.cookie_file, 'rb') as f:
                     cookies = pickle.load(f)
                     self.session.cookies.update(cookies)
+                self._cookie_hash = self._cookie_fingerprint()
                 logger.debug("Cookies loaded from file")
+        except (pickle.UnpicklingError, EOFError) as e:
+            # A truncated or corrupt jar only costs a fresh login; drop it so it is not read again
+            logger.warning(f"Saved cookies are unreadable, logging in again: {e}")
+            try:
+                os.remove(self.cookie_file)
+            except OSError:
+                pass
         except Exception as e:
             logger.warning(f"Error loading cookies: {e}")
 
     def save_cookies(self):
-        """Save current cookies to file"""
+        """Save current cookies to file, skipping the write when they are unchanged"""
+        cookie_hash = self._cookie_fingerprint()
+        if cookie_hash == self._cookie_hash:
+            logger.debug("Cookies unchanged, not saving")
+            return
         try:
-            with open(COOKIE_FILE, 'wb') as f:
-                pickle.dump(self.session.cookies, f)
+            # Write to a temporary file first so a crash never leaves a truncated cookie file
+            tmp_file = f"{self.cookie_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(self.session.cookies, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cookie_file)
+            self._cookie_hash = cookie_hash
             logger.debug("Cookies saved to file")
         except Exception as e:
             logger.warning(f"Error saving cookies: {e}")
@@ -103,7 +395,7 @@ class MIRCrewExtractor(ForumExtractor):
         try:
             if os.path.exists(self.cache_file):
                 with open(self.cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = yaml.safe_load(f)
+                    cache_data = yaml.load(f, Loader=YamlLoader)
                     if cache_data and 'thread_cache' in cache_data:
                         loaded_cache = cache_data['thread_cache']
                         # Convert legacy format to new format for backward compatibility
@@ -112,16 +404,25 @@ class MIRCrewExtractor(ForumExtractor):
                                 # Legacy format - convert to new format
                                 loaded_cache[key] = {
                                     'thread_id': value,
-                                    'timestamp': datetime.now().isoformat()  # Use current time for legacy entries
+                                    'timestamp': datetime.now().isoformat(),  # Use current time for legacy entries
+                                    'ts': time.time()
                                 }
                             elif isinstance(value, dict) and 'thread_id' not in value:
                                 # Malformed entry - fix it
                                 if isinstance(value, dict):
                                     loaded_cache[key] = {
                                         'thread_id': str(value),
-                                        'timestamp': datetime.now().isoformat()
+                                        'timestamp': datetime.now().isoformat(),
+                                        'ts': time.time()
                                     }
-                        self.thread_id_cache = loaded_cache
+                            elif isinstance(value, dict) and 'ts' not in value:
+                                # Older entry - parse its ISO timestamp once instead of on every check
+                                try:
+                                    value['ts'] = _entry_timestamp(value)
+                                except (KeyError, TypeError, ValueError):
+                                    pass
+                        # Keep entries oldest first, the order _manage_cache_size evicts in
+                        self.thread_id_cache = dict(sorted(loaded_cache.items(), key=_entry_age_key))
                         logger.debug(f"Loaded {len(self.thread_id_cache)} cached thread IDs")
                     else:
                         self.thread_id_cache = {}
@@ -147,30 +448,53 @@ class MIRCrewExtractor(ForumExtractor):
                     # Legacy format - convert to new format
                     saveable_cache[key] = {
                         'thread_id': str(value),
-                        'timestamp': datetime.now().isoformat()
+                        'timestamp': datetime.now().isoformat(),
+                        'ts': time.time()
                     }
 
             cache_data = {'thread_cache': saveable_cache}
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                yaml.dump(cache_data, f, default_flow_style=False, allow_unicode=True)
+            # Write to a temporary file first so a crash never leaves a truncated cache file
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                yaml.dump(cache_data, f, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True,
+                          sort_keys=False)
+            os.replace(tmp_file, self.cache_file)
+            self._cache_dirty = 0
+            self._last_flush = time.monotonic()
             logger.debug(f"Saved {len(self.thread_id_cache)} thread IDs to cache")
         except Exception as e:
             logger.warning(f"Error saving cache: {e}")
 
+    def flush_cache(self):
+        """Save the thread ID cache if it has unsaved changes"""
+        if self._cache_dirty:
+            self.save_cache()
+
+    def checkpoint(self):
+        """Persist cookies and thread ID cache together, writing only what changed"""
+        self.save_cookies()
+        self.flush_cache()
+
+    def close(self):
+        """Persist pending cookies and cache entries"""
+        self.checkpoint()
+
+    def _maybe_flush_cache(self):
+        """Save the thread ID cache once enough changes or time have accumulated"""
+        if self._cache_dirty and (self._cache_dirty >= CACHE_FLUSH_BATCH or
+                                  time.monotonic() - self._last_flush >= CACHE_FLUSH_INTERVAL):
+            self.save_cache()
+
     def get_cached_thread_id(self, series_title, season):
         """Get cached thread ID for series and season"""
         if not self.cache_loaded:
             self.load_cache()
+        self._maybe_flush_cache()
 
         if not series_title or not season:
             return None
 
-        # Normalize season format
-        try:
-            season_num = int(season)
-            cache_key = f"{series_title} S{season_num:02d}"
-        except (ValueError, TypeError):
-            cache_key = f"{series_title} S{season}"
+        cache_key = _thread_cache_key(series_title, season)
 
         cache_entry = self.thread_id_cache.get(cache_key)
         if cache_entry:
@@ -178,18 +502,19 @@ class MIRCrewExtractor(ForumExtractor):
             if isinstance(cache_entry, dict):
                 thread_id = cache_entry.get('thread_id')
                 # Check if entry has expired
-                if 'timestamp' in cache_entry:
+                if 'ts' in cache_entry or 'timestamp' in cache_entry:
                     try:
-                        entry_date = datetime.fromisoformat(cache_entry['timestamp'])
-                        if entry_date < datetime.now() - timedelta(days=180):
+                        if _entry_timestamp(cache_entry) < time.time() - CACHE_ENTRY_MAX_AGE:
                             logger.debug(f"Cache entry expired for '{cache_key}'")
                             del self.thread_id_cache[cache_key]
+                            self._cache_dirty += 1
                             self.cache_misses += 1
                             self._log_cache_metrics()
                             return None
                     except (ValueError, TypeError):
                         logger.debug(f"Invalid timestamp for '{cache_key}', treating as expired")
                         del self.thread_id_cache[cache_key]
+                        self._cache_dirty += 1
                         self.cache_misses += 1
                         self._log_cache_metrics()
                         return None
@@ -215,10 +540,11 @@ class MIRCrewExtractor(ForumExtractor):
             return
 
         # Log metrics every 10 lookups or if it's been more than 5 minutes since last log
-        current_time = datetime.now()
+        # (monotonic clock: cheaper than datetime.now() on every lookup)
+        current_time = time.monotonic()
         should_log = (total_lookups % 10 == 0 or
                      self.cache_last_metrics_log is None or
-                     (current_time - self.cache_last_metrics_log).total_seconds() > 300)
+                     current_time - self.cache_last_metrics_log > 300)
 
         if should_log:
             hit_rate = (self.cache_hits / total_lookups) * 100
@@ -233,30 +559,24 @@ class MIRCrewExtractor(ForumExtractor):
 
         # If still over limit, evict oldest entries (LRU-style)
         if len(self.thread_id_cache) >= self.cache_max_size:
-            # Sort by timestamp and keep only the most recent entries
-            sorted_entries = sorted(
-                self.thread_id_cache.items(),
-                key=lambda x: datetime.fromisoformat(x[1]['timestamp']) if isinstance(x[1], dict) else datetime.min,
-                reverse=True
-            )
-            # Keep only the most recent 80% of max size to leave room for new entries
+            # Entries are kept oldest first, so keep only the most recent 80% of max size
+            # by dropping from the front, leaving room for new entries
             keep_count = int(self.cache_max_size * 0.8)
-            entries_to_keep = dict(sorted_entries[:keep_count])
-            removed_count = len(self.thread_id_cache) - len(entries_to_keep)
+            removed_count = len(self.thread_id_cache) - keep_count
+            for key in list(islice(self.thread_id_cache, removed_count)):
+                del self.thread_id_cache[key]
             if removed_count > 0:
                 logger.info(f"Cache size management: removed {removed_count} old entries")
-            self.thread_id_cache = entries_to_keep
 
     def _clean_expired_entries(self):
         """Remove entries that have expired (older than 6 months)"""
-        cutoff_date = datetime.now() - timedelta(days=180)  # 6 months
+        cutoff = time.time() - CACHE_ENTRY_MAX_AGE
         expired_keys = []
 
         for key, value in self.thread_id_cache.items():
-            if isinstance(value, dict) and 'timestamp' in value:
+            if isinstance(value, dict) and ('ts' in value or 'timestamp' in value):
                 try:
-                    entry_date = datetime.fromisoformat(value['timestamp'])
-                    if entry_date < cutoff_date:
+                    if _entry_timestamp(value) < cutoff:
                         expired_keys.append(key)
                 except (ValueError, TypeError):
                     # If timestamp is malformed, treat as expired
@@ -276,82 +596,90 @@ class MIRCrewExtractor(ForumExtractor):
         if not series_title or not season or not thread_id:
             return
 
-        # Normalize season format
-        try:
-            season_num = int(season)
-            cache_key = f"{series_title} S{season_num:02d}"
-        except (ValueError, TypeError):
-            cache_key = f"{series_title} S{season}"
+        cache_key = _thread_cache_key(series_title, season)
 
         # Check cache size and evict if necessary
         self._manage_cache_size()
 
-        # Add entry with timestamp
+        # Add entry with timestamp, moving an existing key to the end so the cache stays oldest first
+        self.thread_id_cache.pop(cache_key, None)
         self.thread_id_cache[cache_key] = {
             'thread_id': str(thread_id),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat(),
+            'ts': time.time()
         }
         logger.debug(f"Cached thread ID for '{cache_key}': {thread_id}")
 
-        # Save cache immediately for persistence
-        self.save_cache()
+        # Defer the write so bursts of inserts cost a single save
+        self._cache_dirty += 1
+        self._maybe_flush_cache()
+
+    def _get_sid(self):
+        """Get the session ID cookie value (phpBB names it <prefix>_sid), or None"""
+        cookies = self.session.cookies
+        return cookies.get('sid') or next(
+            (value for name, value in cookies.items() if name.endswith('sid')), None)
 
-    def login(self, retries=15, initial_wait=5):
+    def login(self, retries=3):
         """Login to MIRCrew, returns sid if ok, False if fails"""
         # Check if already logged in first
         if self.is_already_logged_in():
             logger.info("Already authenticated on MIRCrew")
             # Try to get existing SID
-            for cookie in self.session.cookies:
-                if "sid" in cookie.name:
-                    return cookie.value
-            return True
+            self._sid = self._get_sid()
+            return self._sid or True
 
         def is_logged_in(soup):
-            """Check if user is logged in based on page content"""
-            # Check for login failure indicators first
-            error_indicators = [
-                soup.find(string=re.compile(r'(?i)login.*failed|invalid.*credentials|wrong.*password|access.*denied')),
-                soup.find('div', {'class': re.compile(r'error|alert')}, string=re.compile(r'(?i)login|password')),
-                soup.find('form', {'id': 'login'})  # Still showing login form indicates failure
-            ]
-
-            if any(error_indicators):
-                logger.debug("Login failure indicators found on page")
-                return False
-
-            # Check for success indicators
-            success_indicators = [
-                soup.find('a', {'href': re.compile(r'mode=logout')}),
-                soup.find('a', {'href': re.compile(r'logout')}),
-                soup.find('a', string=re.compile(r'(?i)logout|esci|log out')),
-                soup.find(['span', 'div', 'a'], string=re.compile(f'(?i){re.escape(MIRCREW_USERNAME)}')),
-                soup.find('strong', string=re.compile(f'(?i){re.escape(MIRCREW_USERNAME)}')),
-                soup.find(string=re.compile(r'(?i)welcome.*back|benvenuto|logged.*in')),
-                soup.find('div', {'class': re.compile(r'user.*panel|welcome')}),
-                soup.find('li', {'class': 'user-info'})
-            ]
-
-            logged_in = any(success_indicators)
-            logger.debug(f"Login verification: {len([x for x in success_indicators if x])} success indicators found")
-            return logged_in
+            """Check if user is logged in based on page content, in a single pass over the page"""
+            username_re = self._username_re
+            success_indicators = set()
+            for node in soup.descendants:
+                if isinstance(node, Tag):
+                    name = node.name
+                    text = node.string
+                    if name == 'form' and node.get('id') == 'login':
+                        # Still showing login form indicates failure
+                        logger.debug("Login failure indicators found on page")
+                        return False
+                    if name == 'div':
+                        classes = ' '.join(node.get('class') or ())
+                        if text and _ERROR_CLASS_RE.search(classes) and _LOGIN_TEXT_RE.search(text):
+                            logger.debug("Login failure indicators found on page")
+                            return False
+                        if _USER_PANEL_RE.search(classes):
+                            success_indicators.add('user_panel')
+                    elif name == 'a':
+                        href = node.get('href') or ''
+                        if _MODE_LOGOUT_RE.search(href):
+                            success_indicators.add('mode_logout_link')
+                        if _LOGOUT_HREF_RE.search(href):
+                            success_indicators.add('logout_link')
+                        if text and _LOGOUT_TEXT_RE.search(text):
+                            success_indicators.add('logout_text')
+                    elif name == 'li' and 'user-info' in (node.get('class') or ()):
+                        success_indicators.add('user_info')
+                    if text and username_re and name in ('span', 'div', 'a', 'strong') and username_re.search(text):
+                        success_indicators.add('username_strong' if name == 'strong' else 'username')
+                elif isinstance(node, NavigableString):
+                    if _LOGIN_FAILED_RE.search(node):
+                        logger.debug("Login failure indicators found on page")
+                        return False
+                    if _WELCOME_RE.search(node):
+                        success_indicators.add('welcome')
 
+            logger.debug(f"Login verification: {len(success_indicators)} success indicators found")
+            return bool(success_indicators)
+
+        # Transport errors are retried with backoff by the session adapter,
+        # so these attempts only cover login-level failures
         for attempt in range(retries):
             try:
-                # Exponential backoff with jitter for retries
-                if attempt > 0:
-                    wait_time = min(initial_wait * (2 ** (attempt - 1)), 300)  # Cap at 5 minutes
-                    jitter = random.uniform(0.5, 1.5)  # Add some randomness
-                    actual_wait = wait_time * jitter
-                    logger.info(f"Retrying login in {actual_wait:.1f} seconds... (attempt {attempt+1}/{retries})")
-                    time.sleep(actual_wait)
-
                 login_url = urljoin(MIRCREW_BASE_URL, "ucp.php?mode=login")
                 logger.info(f"Login attempt {attempt+1}/{retries}")
 
                 # Get login form with timeout and retry on failure
                 try:
-                    resp = self.session.get(login_url, timeout=30)
+                    resp = self.session.get(login_url, timeout=REQUEST_TIMEOUT)
                     resp.raise_for_status()
                 except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
                     logger.warning(f"Error requesting login form: {e}")
@@ -360,7 +688,7 @@ class MIRCrewExtractor(ForumExtractor):
                         return False
                     continue
 
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                soup = BeautifulSoup(_response_html(resp), HTML_PARSER, parse_only=_LOGIN_FORM_STRAINER)
                 form = soup.find('form', {'id': 'login'})
                 if not form or not isinstance(form, Tag):
                     logger.error("Login form not found on page")
@@ -372,18 +700,13 @@ class MIRCrewExtractor(ForumExtractor):
                 if not form_action.startswith('http'):
                     form_action = urljoin(MIRCREW_BASE_URL, form_action)
 
+                # Only named inputs are submitted; unchecked checkboxes are left out
                 login_data = {}
-                for input_tag in form.find_all('input'):
-                    if not isinstance(input_tag, Tag):
-                        continue
-                    name = input_tag.attrs.get('name')
-                    if name:
-                        input_type = str(input_tag.attrs.get('type', 'text')).lower()
-                        if input_type == 'checkbox':
-                            if input_tag.attrs.get('checked'):
-                                login_data[name] = input_tag.attrs.get('value', 'on')
-                        else:
-                            login_data[name] = input_tag.attrs.get('value', '')
+                for input_tag in form.select('input[name]'):
+                    if input_tag.get('type', 'text').lower() != 'checkbox':
+                        login_data[input_tag['name']] = input_tag.get('value', '')
+                    elif input_tag.has_attr('checked'):
+                        login_data[input_tag['name']] = input_tag.get('value', 'on')
 
                 login_data.update({
                     'username': MIRCREW_USERNAME,
@@ -396,7 +719,7 @@ class MIRCrewExtractor(ForumExtractor):
 
                 # Submit login with timeout and retry on failure
                 try:
-                    resp = self.session.post(form_action, data=login_data, allow_redirects=True, timeout=30)
+                    resp = self.session.post(form_action, data=login_data, allow_redirects=True, timeout=REQUEST_TIMEOUT)
                     logger.info(f"Login POST status: {resp.status_code}, URL finale: {resp.url}")
                 except (requests.exceptions.RequestException, requests.exceptions.Timeout) as e:
                     logger.warning(f"Error sending login data: {e}")
@@ -412,18 +735,15 @@ class MIRCrewExtractor(ForumExtractor):
                     continue
 
                 # Check if login succeeded
-                soup = BeautifulSoup(resp.text, 'html.parser')
+                soup = BeautifulSoup(_response_html(resp), HTML_PARSER)
 
                 if is_logged_in(soup):
                     # Try to get session ID from cookies
-                    sid = None
-                    for cookie in self.session.cookies:
-                        if "sid" in cookie.name:
-                            sid = cookie.value
-                            break
+                    sid = self._sid = self._get_sid()
+                    self._session_verified_at = time.monotonic()
 
-                    # Save cookies for future sessions
-                    self.save_cookies()
+                    # Save cookies and pending cache entries for future sessions
+                    self.checkpoint()
 
                     if sid:
                         logger.info(f"Login successful with SID: {sid[:8]}...")
@@ -435,7 +755,7 @@ class MIRCrewExtractor(ForumExtractor):
                     logger.warning(f"Login attempt {attempt+1} failed - checking page...")
 
                     # Log some debug info about what was found
-                    error_text = soup.find(string=re.compile(r'(?i)error|failed|wrong|invalid'))
+                    error_text = soup.find(string=_PAGE_ERROR_RE)
                     if error_text:
                         error_str = str(error_text).strip()
                         logger.warning(f"Possible error found on page: {error_str[:100]}...")
@@ -452,57 +772,90 @@ class MIRCrewExtractor(ForumExtractor):
 
         return False
 
-    def is_already_logged_in(self):
-        """Check if user is already logged in by visiting the index page"""
-        try:
-            index_url = urljoin(MIRCREW_BASE_URL, "index.php")
-            resp = self.session.get(index_url, timeout=30)
-            resp.raise_for_status()
+    def _has_session_cookies(self):
+        """Whether the cookie jar can hold a member session (phpBB marks guests with <prefix>_u=1)"""
+        if not self.session.cookies:
+            return False
+        return not any(cookie.name.endswith('_u') and cookie.value == '1' for cookie in self.session.cookies)
+
+    def _login_page_status(self):
+        """Session state from a HEAD of the login page: True, False, or None when the status is inconclusive"""
+        # phpBB redirects logged in users away from the login page and serves it to guests,
+        # so a HEAD request answers without downloading or parsing any HTML
+        login_url = urljoin(MIRCREW_BASE_URL, "ucp.php?mode=login")
+        resp = self.session.head(login_url, allow_redirects=False, timeout=REQUEST_TIMEOUT)
+
+        if resp.status_code in (301, 302, 303):
+            return "login" not in resp.headers.get('Location', '')
+        if resp.status_code == 200:
+            return False
+
+        logger.debug(f"Login page HEAD returned {resp.status_code}")
+        return None
+
+    def _ucp_page_status(self):
+        """Session state from the HTML of a small members-only UCP page"""
+        ucp_url = urljoin(MIRCREW_BASE_URL, "ucp.php?i=ucp_main&mode=bookmarks")
+        resp = self.session.get(ucp_url, allow_redirects=False, timeout=REQUEST_TIMEOUT)
 
-            soup = BeautifulSoup(resp.text, 'html.parser')
+        if resp.status_code in (301, 302, 303) and "login" in resp.headers.get('Location', ''):
+            logger.debug("Redirected to login - not logged in")
+            return False
+        resp.raise_for_status()
 
-            # Check for login form - if present, not logged in
-            if soup.find('form', {'id': 'login'}):
-                logger.debug("Login form found - not logged in")
-                return False
+        # Guests get phpBB's login box instead of the page
+        page = _response_html(resp)
+        if _LOGIN_FORM_HTML_RE.search(page):
+            logger.debug("Login form found - not logged in")
+            return False
 
-            # Check for logout link or username - indicates logged in
-            logout_links = soup.find_all('a', {'href': re.compile(r'(mode=logout|logout)')})
-            username_elements = soup.find_all(['span', 'div', 'a'], string=re.compile(f'(?i){re.escape(MIRCREW_USERNAME)}'))
+        # The navbar shows a logout link on every page for logged in users
+        if _LOGOUT_LINK_HTML_RE.search(page):
+            logger.debug("Logout link found - already logged in")
+            return True
 
-            if logout_links or username_elements:
-                logger.debug("Logout link or username found - already logged in")
-                return True
+        logger.debug("Unable to determine login status from UCP page")
+        return False
 
-            logger.debug("Unable to determine login status from index page")
+    def is_already_logged_in(self):
+        """Check if user is already logged in, reading page content only when the login page status is inconclusive"""
+        # Without a member session cookie there is no session to check
+        if not self._has_session_cookies():
+            logger.debug("No member session cookies - not logged in")
             return False
 
+        try:
+            logged_in = self._login_page_status()
+            if logged_in is None:
+                logged_in = self._ucp_page_status()
+            logger.debug(f"Login status: {'logged in' if logged_in else 'not logged in'}")
+            return logged_in
         except Exception as e:
             logger.warning(f"Error checking login status: {e}")
             return False
 
     def verify_session(self):
-        """Verify if the session is still valid"""
-        try:
-            # First try a quick check by visiting index
-            if self.is_already_logged_in():
-                return True
-
-            # Fallback to the original method
-            test_url = urljoin(MIRCREW_BASE_URL, "ucp.php?mode=login")
-            resp = self.session.get(test_url, allow_redirects=False, timeout=30)
-
-            if resp.status_code == 302 and "login" in resp.headers.get('Location', ''):
-                logger.warning("Session expired - redirecting to login")
-                return False
+        """Verify if the session is still valid from the login page's status alone"""
+        verified_at = self._session_verified_at
+        if verified_at is not None and time.monotonic() - verified_at < SESSION_VERIFY_TTL:
+            logger.debug("Session verified recently, skipping check")
+            return True
+        self._session_verified_at = None
 
-            # If we get here without redirect, check the page content
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            if soup.find('form', {'id': 'login'}):
-                logger.warning("Session expired - login form present")
-                return False
+        if not self._has_session_cookies():
+            logger.warning("Session expired - no member session cookies")
+            return False
 
-            return True
+        try:
+            valid = self._login_page_status()
+            if valid is None:
+                # Unexpected status (e.g. HEAD blocked by a proxy), check page content instead
+                valid = self._ucp_page_status()
+            elif not valid:
+                logger.warning("Session expired - login page served")
+            if valid:
+                self._session_verified_at = time.monotonic()
+            return valid
         except Exception as e:
             logger.warning(f"Error verifying session: {e}")
             return False
@@ -512,27 +865,12 @@ class MIRCrewExtractor(ForumExtractor):
         if not url:
             return None
 
-        # Handle both absolute and relative URLs
-        if url.startswith('http'):
-            parsed = urlparse(url)
-            path = parsed.path
-            query = parsed.query
-        else:
-            path = url
-            query = ''
-
-        # Extract thread ID from various URL patterns
-        patterns = [
-            r'viewtopic\.php\?f=\d+&t=(\d+)',  # viewtopic.php?f=52&t=12345
-            r't=(\d+)',                         # t=12345 parameter
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                thread_id = match.group(1)
-                logger.debug(f"Extracted thread ID '{thread_id}' from URL: {url}")
-                return thread_id
+        # The pattern works on absolute and relative URLs alike, no need to parse them
+        match = _THREAD_ID_RE.search(url)
+        if match:
+            thread_id = match.group(1)
+            logger.debug(f"Extracted thread ID '{thread_id}' from URL: {url}")
+            return thread_id
 
         logger.warning(f"Could not extract thread ID from URL: {url}")
         return None
@@ -556,18 +894,56 @@ class MIRCrewExtractor(ForumExtractor):
         # Try multiple search strategies with increasing specificity
         search_strategies = self._build_enhanced_search_queries(release_title, series_title, season, episode)
 
-        for strategy_name, query in search_strategies:
-            logger.info(f"Trying {strategy_name}: {query}")
-            encoded_query = quote_plus(f'"{query}"')
-            thread_url = self._perform_search(encoded_query)
-
-            if thread_url:
-                logger.info(f"Found thread using {strategy_name}")
-                return thread_url
+        thread_url = self._run_search_strategies(search_strategies)
+        if thread_url:
+            return thread_url
 
         logger.warning("No thread found with any enhanced search strategy")
         return None
 
+    def _run_search_strategies(self, strategies):
+        """Search (name, query) strategies in priority order and return the first thread URL found"""
+        # Overlapping strategies often produce the same query, search each only once
+        searched = set()
+        pending = deque()
+        for strategy_name, query in strategies:
+            query_key = query.lower().strip()
+            if query_key not in searched:
+                searched.add(query_key)
+                pending.append((strategy_name, query))
+
+        # Await strategies one at a time while prefetching the next few; once one hits,
+        # searches that have not reached the forum yet are skipped instead of sent
+        stop = threading.Event()
+
+        def search(encoded_query):
+            if stop.is_set():
+                return None
+            return self._perform_search(encoded_query)
+
+        executor = ThreadPoolExecutor(max_workers=SEARCH_PREFETCH + 1)
+        in_flight = deque()
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) <= SEARCH_PREFETCH:
+                    strategy_name, query = pending.popleft()
+                    logger.info(f"Trying {strategy_name}: {query}")
+                    in_flight.append((strategy_name, executor.submit(search, quote_plus(f'"{query}"'))))
+
+                strategy_name, future = in_flight.popleft()
+                try:
+                    thread_url = future.result()
+                except Exception as e:
+                    logger.warning(f"Search using {strategy_name} raised an error: {e}")
+                    continue
+                if thread_url:
+                    logger.info(f"Found thread using {strategy_name}")
+                    return thread_url
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+        return None
+
     def _build_enhanced_search_queries(self, release_title, series_title=None, season=None, episode=None):
         """Build multiple search queries with increasing specificity using available metadata"""
         queries = []
@@ -609,21 +985,23 @@ class MIRCrewExtractor(ForumExtractor):
         for query_type, query in metadata_queries:
             queries.append((f"metadata_{query_type}", query))
 
-        return queries
+        # Drop repeated queries, keeping the first (most specific) strategy for each
+        seen = set()
+        unique_queries = []
+        for strategy_name, query in queries:
+            key = query.lower().strip()
+            if key not in seen:
+                seen.add(key)
+                unique_queries.append((strategy_name, query))
+        return unique_queries
 
     def _clean_release_title_for_search(self, title):
         """Clean release title by removing common unwanted metadata"""
-        # Remove file extensions
-        title = re.sub(r'\.(mkv|mp4|avi|m4v|mov)$', '', title, flags=re.IGNORECASE)
-
-        # Remove quality/resolution info that might interfere with search
-        title = re.sub(r'\b(1080p|720p|2160p|4K|UHD|BluRay|WEB-DL|HDTV)\b', '', title, flags=re.IGNORECASE)
-
-        # Remove common release group patterns
-        title = re.sub(r'-\w+$', '', title)
+        # Remove file extension, quality/resolution info and release group in a single scan
+        title = _RELEASE_NOISE_RE.sub('', title)
 
         # Clean up extra spaces
-        title = re.sub(r'\s+', ' ', title).strip()
+        title = _WHITESPACE_RE.sub(' ', title).strip()
 
         return title
 
@@ -633,6 +1011,12 @@ class MIRCrewExtractor(ForumExtractor):
             logger.warning("No thread ID provided")
             return None
 
+        thread_url = f"{MIRCREW_BASE_URL}viewtopic.php?f=51&t={thread_id}"
+        verified_at = self._verified_thread_ids.get(str(thread_id))
+        if verified_at is not None and time.monotonic() - verified_at < THREAD_VERIFY_TTL:
+            logger.debug(f"Thread {thread_id} verified recently, skipping check")
+            return thread_url
+
         if not self.verify_session():
             logger.warning("Session expired, attempting re-login...")
             if not self.login():
@@ -640,14 +1024,14 @@ class MIRCrewExtractor(ForumExtractor):
                 return None
             logger.info("Re-login successful")
 
-        thread_url = f"{MIRCREW_BASE_URL}viewtopic.php?f=51&t={thread_id}"
         logger.info(f"Using direct thread access: {thread_url}")
 
         # Verify the thread exists by making a quick request
         try:
-            response = self.session.get(thread_url, timeout=30)
+            response = self.session.get(thread_url, timeout=REQUEST_TIMEOUT)
             if response.status_code == 200 and "viewtopic.php" in response.url:
                 logger.info(f"Thread {thread_id} exists and is accessible")
+                self._verified_thread_ids[str(thread_id)] = time.monotonic()
                 return thread_url
             else:
                 logger.warning(f"Thread {thread_id} not found or not accessible")
@@ -657,7 +1041,6 @@ class MIRCrewExtractor(ForumExtractor):
             return None
 
     def search_thread_by_release_title(self, release_title):
-        """Search thread by release title using the existing session with enhanced fallback strategies"""
         """Search thread by release title using the existing session with enhanced fallback strategies"""
         if not self.verify_session():
             logger.warning("Session expired, attempting re-login...")
@@ -666,40 +1049,17 @@ class MIRCrewExtractor(ForumExtractor):
                 return None
             logger.info("Re-login successful, continuing search...")
 
-        base_search_url = urljoin(MIRCREW_BASE_URL, "search.php")
-
-        # Strategy 1: Exact match with full title
-        logger.info(f"Searching for exact match: {release_title}")
-        encoded_query = quote_plus(f"\"{release_title}\"")
-        thread_url = self._perform_search(encoded_query)
+        # Exact title first, then metadata-aware queries, then the season-level fallback
+        strategies = [("exact match", release_title)]
+        strategies.extend(self._extract_enhanced_search_queries(release_title))
+        season_query = self._extract_season_search_query(release_title)
+        if season_query:
+            strategies.append(("season-level search", season_query))
 
+        thread_url = self._run_search_strategies(strategies)
         if thread_url:
-            logger.info("Found thread with exact match")
             return thread_url
 
-        # Strategy 2: Enhanced metadata-aware search
-        logger.info("Exact match failed, trying enhanced metadata search...")
-        enhanced_queries = self._extract_enhanced_search_queries(release_title)
-
-        for query_type, query in enhanced_queries:
-            logger.info(f"Trying {query_type}: {query}")
-            encoded_query = quote_plus(f"\"{query}\"")
-            thread_url = self._perform_search(encoded_query)
-            if thread_url:
-                logger.info(f"Found thread with {query_type}")
-                return thread_url
-
-        # Strategy 3: Season-level fallback (original method)
-        logger.info("Enhanced searches failed, trying season-level search...")
-        season_query = self._extract_season_search_query(release_title)
-        if season_query:
-            logger.info(f"Searching for season-level: {season_query}")
-            encoded_query = quote_plus(f"\"{season_query}\"")
-            thread_url = self._perform_search(encoded_query)
-            if thread_url:
-                logger.info("Found thread with season-level search")
-                return thread_url
-
         logger.warning("No thread found with any search strategy")
         return None
 
@@ -724,14 +1084,9 @@ class MIRCrewExtractor(ForumExtractor):
                 else:
                     logger.warning(f"Cached thread ID {cached_thread_id} no longer valid, removing from cache")
                     # Remove invalid cache entry
-                    try:
-                        season_num = int(season)
-                        cache_key = f"{series_title} S{season_num:02d}"
-                        if cache_key in self.thread_id_cache:
-                            del self.thread_id_cache[cache_key]
-                            self.save_cache()
-                    except (ValueError, TypeError):
-                        pass
+                    if self.thread_id_cache.pop(_thread_cache_key(series_title, season), None) is not None:
+                        self._cache_dirty += 1
+                        self._maybe_flush_cache()
 
         # Cache miss or no metadata available - fallback to forum search
         logger.info("Cache miss or insufficient metadata, performing forum search...")
@@ -748,44 +1103,49 @@ class MIRCrewExtractor(ForumExtractor):
         return thread_url
 
     def _perform_search(self, encoded_query):
-        """Perform the actual search with given query and return detailed results"""
-        params = {
-            "keywords": f"{encoded_query}",
-            "terms": "all",
-            "author": "",
-            "fid[]": ["28", "51", "52", "30"],
-            "sc": "1",
-            "sf": "titleonly",
-            "sr": "topics",
-            "sk": "t",
-            "sd": "d",
-            "st": "0",
-            "ch": "300",
-            "t": "0",
-            "submit": "Cerca"
-        }
+        """Perform the search with given query, reusing a recent successful result for the same query"""
+        now = time.monotonic()
+        with self._search_cache_lock:
+            cached = self._search_cache.get(encoded_query)
+            if cached and now - cached[0] < SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(encoded_query)
+                logger.debug(f"Using cached search result for {encoded_query}")
+                return cached[1]
+
+        thread_url = self._search_forum(encoded_query)
+        if thread_url:
+            with self._search_cache_lock:
+                self._search_cache[encoded_query] = (time.monotonic(), thread_url)
+                self._search_cache.move_to_end(encoded_query)
+                if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return thread_url
 
+    def _search_forum(self, encoded_query):
+        """Perform the actual search with given query and return the first thread URL found"""
         try:
-            request_text = f"https://mircrew-releases.org/search.php?keywords={encoded_query}&terms=all&author=&fid%5B%5D=28&fid%5B%5D=51&fid%5B%5D=52&fid%5B%5D=30&sc=1&sf=titleonly&sr=topics&sk=t&sd=d&st=0&ch=300&t=0&submit=Cerca"
-
-            response = self.session.get(request_text)
+            response = self.session.get(SEARCH_URL_TEMPLATE.format(query=encoded_query), timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
         except Exception as e:
             logger.error(f"HTTP error during search on MIRCrew: {e}")
             return None
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = _response_html(response)
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=_SEARCH_RESULTS_STRAINER)
 
         search_results_container = soup.find('ul', {'class': 'topiclist topics'})
         if not search_results_container or not isinstance(search_results_container, Tag):
-            logger.warning("Search results container not found (ul.topiclist.topics)")
+            if _LOGIN_FORM_HTML_RE.search(html):
+                # The session ended since it was last verified, so the next check must hit the forum
+                logger.warning("Search served the login form - session expired")
+                self._session_verified_at = None
+            else:
+                logger.warning("Search results container not found (ul.topiclist.topics)")
             return None
 
         logger.info("Search results container found, searching for thread...")
 
-        # Collect all potential thread results for better matching
-        thread_results = []
-
+        # Results come back newest first; the first topic link is the most relevant one
         for row in search_results_container.find_all('li', {'class': 'row'}):
             if not isinstance(row, Tag):
                 continue
@@ -809,30 +1169,13 @@ class MIRCrewExtractor(ForumExtractor):
             else:
                 thread_url = urljoin(MIRCREW_BASE_URL, href_str)
 
-            # Extract thread title for matching
             thread_title = topic_link.get_text().strip()
-
-            # Extract thread ID
             thread_id = self.extract_thread_id_from_url(thread_url)
+            logger.info(f"MIRCrew thread found: {thread_title} (ID: {thread_id})")
+            return thread_url
 
-            thread_info = {
-                'url': thread_url,
-                'title': thread_title,
-                'thread_id': thread_id,
-                'score': 0  # Will be used for ranking results
-            }
-
-            thread_results.append(thread_info)
-            logger.debug(f"Found thread: {thread_title} (ID: {thread_id})")
-
-        if not thread_results:
-            logger.warning("No MIRCrew threads found in search.")
-            return None
-
-        # Return the first (most relevant) result
-        best_result = thread_results[0]
-        logger.info(f"MIRCrew thread found: {best_result['title']} (ID: {best_result['thread_id']})")
-        return best_result['url']
+        logger.warning("No MIRCrew threads found in search.")
+        return None
 
     def _extract_enhanced_search_queries(self, release_title):
         """Extract multiple enhanced search queries from release title including metadata"""
@@ -845,11 +1188,12 @@ class MIRCrewExtractor(ForumExtractor):
             if not base_title:
                 return queries
 
-            # Extract metadata components
-            resolution = self._extract_resolution(release_title)
-            codec = self._extract_codec(release_title)
-            year = self._extract_year(release_title)
-            season_num = self._extract_season_number(release_title)
+            # Extract metadata components in a single scan
+            meta = self._extract_all_meta(release_title)
+            resolution = meta['resolution']
+            codec = meta['codec']
+            year = meta['year']
+            season_num = meta['season']
 
             # Strategy 1: Series + Season + Resolution + Codec
             if season_num and (resolution or codec):
@@ -900,104 +1244,30 @@ class MIRCrewExtractor(ForumExtractor):
     def _extract_base_series_name(self, release_title):
         """Extract the base series name without season/episode metadata"""
         try:
-            title = release_title.strip()
-
-            # Remove common suffixes and metadata
-            title = re.sub(r'\s*\[.*?\]', '', title, flags=re.IGNORECASE)  # Remove [IN CORSO], [03/10], etc.
-            title = re.sub(r'\s*\([^)]*\)\s*$', '', title, flags=re.IGNORECASE)  # Remove trailing parentheses
-
-            # Handle multi-episode ranges first
-            multi_episode_pattern = r"(.*?)(?:\s+S\d+E\d+[-~]S?\d*E\d+.*|\s+S\d+E\d+E\d+.*|\s+S\d+E\d+-\d+.*|\s+S\d+E\d+~\d+.*)"
-            match = re.match(multi_episode_pattern, title, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-            # Look for season patterns and extract series name
-            season_patterns = [
-                r'\s*-\s*S\d+E\d+(?:\s*of\s*\d+)?(?:\s*-\s*\d+)?(?:\s*\[.*?\])?.*$',
-                r'\s*-\s*Stagione\s*\d+(?:\s*\[.*?\])?.*$',
-                r'\s*-\s*Season\s*\d+(?:\s*\[.*?\])?.*$',
-                r'\s+(\d+)(?:st|nd|rd|th)\s+Season(?:\s+Episode\s+\d+)?.*$',
-                r'\s+Season\s+\d+\s+Ep(?:\.|\s)?\s*\d+.*$',
-                r'\s+Stagione\s+\d+\s+Ep(?:\.|\s)?\s*\d+.*$',
-                r'\s+\d+x\d+(?:-\d+)?(?:\s*\[.*?\])?.*$',
-                r'\s+S\d+E\d+(?:\s*of\s*\d+)?(?:\s*\[.*?\])?.*$',
-                r'\s*\d+x\d+(?:\s*of\s*\d+)?(?:.*)?$',
-                r'\s+Season\s*\d+(?:\s*\[.*?\])?.*$',  # Added: Season 2 without dash
-                r'\s+Stagione\s*\d+(?:\s*\[.*?\])?.*$',  # Added: Stagione 2 without dash
-            ]
-
-            series_name = title
-            for pattern in season_patterns:
-                match = re.search(pattern, series_name, re.IGNORECASE)
-                if match:
-                    series_name = series_name[:match.start()].strip()
-                    break
-
-            # Clean up series name
-            series_name = re.sub(r'\s+$', '', series_name)  # Trailing spaces
-            series_name = re.sub(r'[-\s]+$', '', series_name)  # Trailing dashes/spaces
-
-            # Validate series name
-            if len(series_name) >= 2:
-                return series_name
-
-            return None
+            return _parse_base_series_name(release_title)
         except Exception as e:
             logger.warning(f"Error extracting base series name: {e}")
             return None
 
+    def _extract_all_meta(self, release_title):
+        """Extract resolution, codec, year and season from release title in one pass"""
+        return dict(_parse_release_meta(release_title))
+
     def _extract_resolution(self, release_title):
         """Extract resolution from release title (e.g., 1080p, 720p, 4K)"""
-        patterns = [
-            r'\b(1080p|720p|2160p|4K|UHD)\b',
-            r'\b(\d{3,4}p)\b',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, release_title, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
+        return _parse_release_meta(release_title)['resolution']
 
     def _extract_codec(self, release_title):
         """Extract codec from release title (e.g., H264, H265, x265)"""
-        patterns = [
-            r'\b(H264|H265|x264|x265|AVC|HEVC)\b',
-            r'\b(XviD|DivX)\b',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, release_title, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
+        return _parse_release_meta(release_title)['codec']
 
     def _extract_year(self, release_title):
         """Extract year from release title"""
-        match = re.search(r'\b(19|20)\d{2}\b', release_title)
-        if match:
-            return match.group(0)
-        return None
+        return _parse_release_meta(release_title)['year']
 
     def _extract_season_number(self, release_title):
         """Extract season number from release title"""
-        patterns = [
-            r'S(\d+)',
-            r'Stagione\s*(\d+)',
-            r'Season\s*(\d+)',
-            r'(\d+)(?:st|nd|rd|th)\s+Season',
-            r'(\d+)x\d+',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, release_title, re.IGNORECASE)
-            if match:
-                return match.group(1)
-
-        return None
+        return _parse_release_meta(release_title)['season']
 
     def _extract_season_search_query(self, release_title):
         """Extract series name and season for season-level search with enhanced logic"""
@@ -1016,110 +1286,41 @@ class MIRCrewExtractor(ForumExtractor):
     def extract_episode_info(self, magnet_element):
         """Extracts episode information from the magnet context with enhanced pattern matching"""
         try:
-            # Multi-level context analysis: check multiple levels up and siblings
+            # Multi-level context analysis: the nearest enclosing element first, then up to
+            # 5 levels out, stopping at the post so neighbouring posts are never consulted.
+            # Each ancestor's text already contains its children's, so siblings and children
+            # need no separate pass, and texts are only built until one of them matches.
             context_elements = []
-            current = magnet_element
-
-            # Check parent hierarchy (up to 5 levels for better context)
-            for _ in range(5):
-                if current and current.parent:
-                    current = current.parent
-                    context_elements.append(current)
-                else:
+            for parent in islice(magnet_element.parents, 5):
+                context_elements.append(parent)
+                if 'postbody' in (parent.get('class') or ()):
                     break
+            if not context_elements:
+                context_elements.append(magnet_element)
+
+            context_texts = (elem.get_text() for elem in context_elements)
 
-            # Check siblings of the magnet element and its parent hierarchy
-            for elem in context_elements:
-                if hasattr(elem, 'find_all'):
-                    siblings = elem.find_all(recursive=False)
-                    context_elements.extend(siblings)
-
-            # Also check magnet element itself and immediate children
-            context_elements.append(magnet_element)
-            if hasattr(magnet_element, 'find_all'):
-                children = magnet_element.find_all(recursive=False)
-                context_elements.extend(children)
-
-            # Remove duplicates while preserving order
-            seen = set()
-            unique_context = []
-            for elem in context_elements:
-                if elem not in seen:
-                    seen.add(elem)
-                    unique_context.append(elem)
-            context_elements = unique_context
-
-            # Combine all context text
-            context_texts = [elem.get_text() for elem in context_elements if elem]
-
-            # Enhanced patterns with comprehensive coverage - reordered for priority
-            patterns = [
-                # Combined season+episode patterns (highest priority)
-                r'S(\d+)E(\d+)(?:\s*of\s*\d+)?',  # S5E04, S5E04 of 10 (adds leading zeros)
-                r'(\d+)x(\d+)(?:-\d+)?',          # 5x04, 5x04-10
-                r'(\d+)(?:st|nd|rd|th)\s+Season\s+Episode\s+(\d+)',  # 5th Season Episode 3
-                r'Season\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)',  # Season 2 Ep 5
-                r'Stagione\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)',  # Stagione 2 Ep 5
-                # Season-level patterns (lower priority)
-                r'Stagione\s*(\d+)',               # Stagione 5
-                r'Season\s*(\d+)',                 # Season 5
-                r'(\d+)(?:st|nd|rd|th)\s+Season',  # 5th Season
-                # Single episode patterns (context-aware)
-                r'(?:^|[^S]\b)Ep\.?\s*(\d+)(?:-(\d+))?',      # Ep 7, Ep 7-10
-                r'(?:^|[^S]\b)Episodio\s+(\d+)(?:\s*-\s*(\d+))?',  # Episodio 7, Episodio 7-10
-                # Additional variants
-                r'Episode\s+(\d+)',               # Episode 7
-                r'Ep\s+(\d+)',                    # Ep 7 (alternative)
-            ]
-
-            # Process patterns in order of specificity
             for text in context_texts:
-                for i, pattern in enumerate(patterns):
-                    match = re.search(pattern, text, re.IGNORECASE)
+                # The most specific pattern found anywhere in the text wins
+                for kind, pattern in _EPISODE_INFO_PATTERNS:
+                    match = pattern.search(text)
                     if match:
-                        groups = match.groups()
-                        # Combined season+episode patterns
-                        if i == 0:  # S(\d+)E(\d+) pattern
-                            season = int(groups[0])
-                            episode = int(groups[1])
-                            return f"S{season:02d}E{episode:02d}"
-                        elif i == 1:  # (\d+)x(\d+) pattern
-                            season = int(groups[0])
-                            episode = int(groups[1])
-                            return f"S{season:02d}E{episode:02d}"
-                        elif i == 2:  # (\d+)(?:st|nd|rd|th)\s+Season\s+Episode\s+(\d+)
-                            season = int(groups[0])
-                            episode = int(groups[1])
-                            return f"S{season:02d}E{episode:02d}"
-                        elif i == 3:  # Season\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)
-                            season = int(groups[0])
-                            episode = int(groups[1])
-                            return f"S{season:02d}E{episode:02d}"
-                        elif i == 4:  # Stagione\s+(\d+)\s+Ep(?:\.|\s)?\s*(\d+)
-                            season = int(groups[0])
-                            episode = int(groups[1])
-                            return f"S{season:02d}E{episode:02d}"
-                        # Season-only patterns
-                        elif i == 5:  # Stagione\s*(\d+)
-                            season = int(groups[0])
-                            return f"S{season:02d}E00"  # Season pack
-                        elif i == 6:  # Season\s*(\d+)
-                            season = int(groups[0])
-                            return f"S{season:02d}E00"  # Season pack
-                        elif i == 7:  # (\d+)(?:st|nd|rd|th)\s+Season
-                            season = int(groups[0])
-                            return f"S{season:02d}E00"  # Season pack
-                        # Single episode patterns with season context
-                        elif i >= 8:  # Single episode patterns
-                            # Check if there's season context in the same text
-                            season_context = re.search(r'S(?:tagione|eason)?\s*(\d+)', text, re.IGNORECASE)
-                            if season_context:
-                                season = int(season_context.group(1))
-                                episode = int(groups[0])
-                                return f"S{season:02d}E{episode:02d}"
-                            else:
-                                episode = int(groups[0])
-                                return f"E{episode:02d}"
+                        break
+                else:
+                    continue
+
+                first = int(match.group(1))
+                if kind == 'episode':
+                    return f"S{first:02d}E{int(match.group(2)):02d}"
+                if kind == 'season':
+                    return f"S{first:02d}E00"  # Season pack
+
+                # Single episode patterns: check if there's season context in the same text
+                season_context = _SEASON_CONTEXT_RE.search(text)
+                if season_context:
+                    season = int(season_context.group(1))
+                    return f"S{season:02d}E{first:02d}"
+                return f"E{first:02d}"
             return "Unknown"
         except Exception as e:
             logger.warning(f"Error extracting episode info: {e}")
@@ -1127,7 +1328,7 @@ class MIRCrewExtractor(ForumExtractor):
 
     def extract_episode_codes(self, magnet_title):
         # Find episode codes like S01E05 in the magnet title
-        return set(re.findall(r"S\d{2}E\d{2}", magnet_title, re.IGNORECASE))
+        return set(_EPISODE_CODE_RE.findall(magnet_title))
 
     def extract_magnets_from_thread(self, thread_url, forum_post_url=None):
         """
@@ -1195,62 +1396,68 @@ class MIRCrewExtractor(ForumExtractor):
             logger.error(f"Error extracting magnets: {e}")
             return []
 
-    def _extract_magnets_from_page(self, url, max_retries=3):
+    def _extract_magnets_from_page(self, url):
         """
-        Helper method to extract magnets from a single page with retry logic.
+        Helper method to extract magnets from a single page.
+
+        Transient HTTP failures are retried with backoff by the session adapter,
+        so a request error here is final for this page.
 
         Args:
             url: URL to fetch and extract from
-            max_retries: Maximum number of retry attempts
 
         Returns:
             List of magnet dictionaries or empty list on failure
         """
-        for attempt in range(max_retries):
-            try:
-                # Fetch page content with timeout
-                resp = self.session.get(url, timeout=30)
-                resp.raise_for_status()
+        try:
+            # Fetch page content with timeout
+            resp = self.session.get(url, timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
 
-                soup = BeautifulSoup(resp.text, 'html.parser')
-                magnets = []
+            # Episode context needs the DOM, but a page without any magnet needs no soup
+            html = _response_html(resp)
+            if not _MAGNET_HREF_RE.search(html):
+                logger.debug(f"No magnet links in {url}")
+                return []
 
-                # Primary regex pattern for magnet link extraction
-                magnet_pattern = r'magnet:\?xt=urn:(?:btih|ed2k):[a-fA-F0-9]{32,64}'
-                magnet_links = soup.find_all('a', href=re.compile(magnet_pattern, re.IGNORECASE))
+            soup = BeautifulSoup(html, HTML_PARSER)
+            magnets = []
+            # Info hashes already collected, so a torrent quoted or reposted is only listed once
+            seen_hashes = set()
 
-                for link in magnet_links:
-                    if not isinstance(link, Tag):
-                        continue
+            magnet_links = soup.find_all('a', href=_MAGNET_HREF_RE)
 
-                    magnet_url = link.attrs.get('href')
-                    if not magnet_url:
-                        continue
+            for link in magnet_links:
+                if not isinstance(link, Tag):
+                    continue
 
-                    magnet_title = extract_magnet_title_from_url(magnet_url)
-                    episode_info = self.extract_episode_info(link)
+                magnet_url = link.attrs.get('href')
+                if not magnet_url:
+                    continue
 
-                    magnets.append({
-                        'magnet': str(magnet_url).strip(),
-                        'episode_info': episode_info,
-                        'magnet_title': magnet_title
-                    })
+                magnet_key = _magnet_key(str(magnet_url))
+                if magnet_key in seen_hashes:
+                    continue
+                seen_hashes.add(magnet_key)
 
-                logger.debug(f"Extracted {len(magnets)} magnet links from {url}")
-                return magnets
+                magnet_title = extract_magnet_title_from_url(magnet_url)
+                episode_info = self.extract_episode_info(link)
 
-            except requests.exceptions.RequestException as e:
-                logger.warning(f"HTTP error on attempt {attempt+1}/{max_retries} for {url}: {e}")
-                if attempt == max_retries - 1:
-                    logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                    return []
-                # Exponential backoff before retry
-                import time
-                time.sleep(2 ** attempt)
+                magnets.append({
+                    'magnet': str(magnet_url).strip(),
+                    'episode_info': episode_info,
+                    'magnet_title': magnet_title
+                })
 
-            except Exception as e:
-                logger.error(f"Unexpected error extracting from {url}: {e}")
-                return []
+            logger.debug(f"Extracted {len(magnets)} magnet links from {url}")
+            return magnets
+
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error extracting from {url}: {e}")
+            return []
 
     def _extract_magnets_legacy_mode(self, thread_url):
         """
@@ -1273,70 +1480,65 @@ class MIRCrewExtractor(ForumExtractor):
 
         try:
             # Fetch the thread page
-            resp = self.session.get(thread_url, timeout=30)
+            resp = self.session.get(thread_url, timeout=REQUEST_TIMEOUT)
             resp.raise_for_status()
 
-            soup = BeautifulSoup(resp.text, 'html.parser')
-
-            # Legacy extraction strategy 1: Enhanced magnet pattern search
-            # Look for magnet links in various content areas for legacy compatibility
-            magnet_pattern = r'magnet:\?xt=urn:(?:btih|ed2k):[a-zA-Z0-9]{8,64}(?:&.*)?'
-
-            # Search in multiple areas of the page for legacy compatibility
-            search_areas = [
-                soup,  # Full page
-                soup.find('div', {'class': 'content'}),  # Main content area
-                soup.find('div', {'class': 'postbody'}),  # Post body
-                soup.find('div', {'class': 'post-content'}),  # Alternative content area
-            ]
+            soup = BeautifulSoup(_response_html(resp), HTML_PARSER)
 
             magnets = []
-
-            for area in search_areas:
-                if not area:
-                    continue
-
-                # Find all magnet links in this area
-                magnet_links = area.find_all('a', href=re.compile(magnet_pattern))
-
-                for link in magnet_links:
-                    if not isinstance(link, Tag):
+            # Info hashes already collected, shared by both strategies, so the same
+            # torrent posted again with other trackers is only listed once
+            seen_hashes = set()
+            # Magnet URIs found in plain text, used only if no anchor had one
+            text_matches = []
+
+            # A single walk over the page serves both strategies. The content areas
+            # (div.content, div.postbody, div.post-content) that used to be searched
+            # again all sit inside the full page, so the same anchors come out in the same order
+            for node in soup.descendants:
+                if isinstance(node, Tag):
+                    # Legacy extraction strategy 1: Enhanced magnet pattern search
+                    if node.name != 'a':
                         continue
-
-                    magnet_url = link.attrs.get('href')
-                    if not magnet_url:
+                    magnet_url = node.attrs.get('href')
+                    if not magnet_url or not _LEGACY_MAGNET_RE.search(magnet_url):
                         continue
 
                     # Skip duplicates
-                    if any(m['magnet'] == magnet_url for m in magnets):
+                    magnet_url = str(magnet_url).strip()
+                    magnet_key = _magnet_key(magnet_url)
+                    if magnet_key in seen_hashes:
                         continue
+                    seen_hashes.add(magnet_key)
 
                     magnet_title = extract_magnet_title_from_url(magnet_url)
-                    episode_info = self.extract_episode_info(link)
+                    episode_info = self.extract_episode_info(node)
 
                     magnets.append({
-                        'magnet': str(magnet_url).strip(),
+                        'magnet': magnet_url,
                         'episode_info': episode_info,
                         'magnet_title': magnet_title
                     })
 
                     logger.debug(f"Found magnet in legacy extraction: {magnet_title}")
+                elif type(node) is NavigableString and 'magnet:' in node:
+                    # Some older posts might have magnet links in plain text format
+                    text_matches.extend(_LEGACY_MAGNET_RE.findall(node))
 
             # Legacy extraction strategy 2: Alternative text-based patterns
-            # Some older posts might have magnet links in plain text format
+            # Look for magnet links that might not be in <a> tags
             if not magnets:
-                text_content = soup.get_text()
-                # Look for magnet links that might not be in <a> tags
-                alt_magnet_matches = re.findall(magnet_pattern, text_content)
-
-                for magnet_match in alt_magnet_matches:
+                for magnet_match in text_matches:
                     # Skip if we already have this magnet
-                    if any(m['magnet'] == magnet_match for m in magnets):
+                    magnet_match = magnet_match.strip()
+                    magnet_key = _magnet_key(magnet_match)
+                    if magnet_key in seen_hashes:
                         continue
+                    seen_hashes.add(magnet_key)
 
                     magnet_title = extract_magnet_title_from_url(magnet_match)
                     magnets.append({
-                        'magnet': str(magnet_match).strip(),
+                        'magnet': magnet_match,
                         'episode_info': 'Unknown',  # Can't extract from plain text
                         'magnet_title': magnet_title
                     })
@@ -1360,19 +1562,14 @@ class MIRCrewExtractor(ForumExtractor):
     def parse_needed_episodes(self, episode_path):
         """Extracts the necessary episodes from the Sonarr path"""
         try:
-            patterns = [
-                r'S(\d+)E(\d+)(?:-E(\d+))?',  # S01E01 o S01E01-E03
-                r'(\d+)x(\d+)(?:-(\d+))?',    # 1x01 o 1x01-03
-            ]
             needed_episodes = set()
-            for pattern in patterns:
-                matches = re.finditer(pattern, episode_path, re.IGNORECASE)
-                for match in matches:
-                    season = int(match.group(1))
+            for pattern in _NEEDED_EPISODE_PATTERNS:
+                for match in pattern.finditer(episode_path):
+                    # The season part is the same for the whole range, format it once
+                    season_prefix = f"S{int(match.group(1)):02d}E"
                     start_ep = int(match.group(2))
                     end_ep = int(match.group(3)) if match.group(3) else start_ep
-                    for ep in range(start_ep, end_ep + 1):
-                        needed_episodes.add(f"S{season:02d}E{ep:02d}")
+                    needed_episodes.update(f"{season_prefix}{ep:02d}" for ep in range(start_ep, end_ep + 1))
             if not needed_episodes and episode_path:
                 logger.warning(f"Unable to parse episodes from: {episode_path}")
             return needed_episodes
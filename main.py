@@ -10,17 +10,23 @@ import os
 import dotenv
 import sys
 import re
+import signal
 import time
 import logging
 import requests
 dotenv.load_dotenv()
 
+# Precompiled episode code patterns, used for every code of every magnet
+_SXXEYY_RE = re.compile(r'S(\d+)E(\d+)', re.IGNORECASE)
+_NXNN_RE = re.compile(r'(\d+)x(\d+)', re.IGNORECASE)
+_SEASON_WORD_RE = re.compile(r'(?:stagione|season)\s*(\d+)', re.IGNORECASE)
+
 
 def validate_episode_code(episode_code):
     """Validate episode code format and values"""
     if not episode_code:
         return False
-    match = re.match(r'S(\d+)E(\d+)', episode_code, re.IGNORECASE)
+    match = _SXXEYY_RE.match(episode_code)
     if not match:
         return False
     season = int(match.group(1))
@@ -35,14 +41,14 @@ def normalize_episode_codes(codes):
         if isinstance(code, str):
             # Handle various formats
             code = code.upper()
-            match = re.match(r'S(\d+)E(\d+)', code)
+            match = _SXXEYY_RE.match(code)
             if match:
                 season = int(match.group(1))
                 episode = int(match.group(2))
                 normalized.add(f"S{season:02d}E{episode:02d}")
             else:
                 # Try 1x01 format
-                match = re.match(r'(\d+)x(\d+)', code)
+                match = _NXNN_RE.match(code)
                 if match:
                     season = int(match.group(1))
                     episode = int(match.group(2))
@@ -117,7 +123,6 @@ def main():
         logger.error("I didn't find a forum thread for this release. Exiting.")
         sys.exit(0)
 
-    original_torrents = extractor.torrent_client.get_torrents()
     magnets = extractor.extract_magnets_from_thread(thread_url)
     if not magnets:
         logger.warning("No magnets found in the thread")
@@ -151,7 +156,7 @@ def main():
         logger.info("No episodes from Sonarr variables, trying to parse from release title...")
 
         # Try to extract specific episode (like S5E04)
-        episode_match = re.search(r'S(\d+)E(\d+)', release_title, re.IGNORECASE)
+        episode_match = _SXXEYY_RE.search(release_title)
         if episode_match:
             season = int(episode_match.group(1))
             episode = int(episode_match.group(2))
@@ -163,7 +168,7 @@ def main():
                 logger.warning(f"Invalid episode code extracted from release title: {episode_code}")
         else:
             # Fallback to season-level extraction
-            season_match = re.search(r'(?:stagione|season)\s*(\d+)', release_title, re.IGNORECASE)
+            season_match = _SEASON_WORD_RE.search(release_title)
             if season_match:
                 extracted_season = int(season_match.group(1))
                 logger.info(f"Season extracted from release_title: {extracted_season}")
@@ -306,4 +311,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Turn SIGTERM into a normal exit so atexit handlers persist cookies and cache
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
     main()
\ No newline at end of file
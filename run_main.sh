@@ -48,6 +48,8 @@ echo "Installing required packages..."
 python3 -c "import requests" 2>/dev/null || install_package requests requests || exit 1
 python3 -c "import bs4" 2>/dev/null || install_package beautifulsoup4 bs4 || exit 1
 python3 -c "import dotenv" 2>/dev/null || install_package python-dotenv dotenv || exit 1
+# Optional: faster HTML parsing, the scripts fall back to html.parser without it
+python3 -c "import lxml" 2>/dev/null || install_package lxml lxml || echo "WARNING: lxml not installed, using html.parser" >&2
 
 # Change to script directory
 cd "$SCRIPT_DIR"
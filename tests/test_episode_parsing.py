@@ -88,4 +88,13 @@ class TestEpisodeParsing:
         assert extractor._extract_base_series_name("Stranger Things S04E01-S04E09") == "Stranger Things"
         assert extractor._extract_base_series_name("The Mandalorian S03E01E02") == "The Mandalorian"
         assert extractor._extract_base_series_name("Loki S02E01-E02") == "Loki"
-        assert extractor._extract_base_series_name("Westworld S04E01~E04") == "Westworld"
\ No newline at end of file
+        assert extractor._extract_base_series_name("Westworld S04E01~E04") == "Westworld"
+
+    def test_normalize_and_validate_episode_codes(self):
+        """Test episode code normalization and validation used when filtering magnets"""
+        from main import normalize_episode_codes, validate_episode_code
+
+        assert normalize_episode_codes({"s1e2", "S01E03", "2x05", "garbage"}) == {"S01E02", "S01E03", "S02E05"}
+        assert validate_episode_code("S01E01")
+        assert not validate_episode_code("S00E01")
+        assert not validate_episode_code("1x01")
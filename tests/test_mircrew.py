@@ -6,15 +6,19 @@ Test suite specifically for MIRCrew forum functionality.
 import os
 import sys
 import re
+import time
 import pytest
 import requests
 from unittest.mock import MagicMock
+from urllib.parse import unquote_plus
+from datetime import datetime
 
 # Add the parent directory to the path so we can import main
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from main import main
-from extractors.mircrew_extractor import MIRCrewExtractor
+from extractors.mircrew_extractor import (MIRCrewExtractor, CACHE_FLUSH_BATCH, REQUEST_TIMEOUT, THREAD_VERIFY_TTL,
+                                          SESSION_VERIFY_TTL, SEARCH_PREFETCH, extract_magnet_title_from_url)
 from torrents.torrent_client import TorrentClient
 
 
@@ -83,6 +87,14 @@ def mock_torrent_client():
             return "mock_hash"
     return MockTorrentClient()
 
+
+@pytest.fixture(autouse=True)
+def isolated_state_files(tmp_path, monkeypatch):
+    """Point the extractor's cookie jar and thread cache at tmp_path instead of the working directory"""
+    monkeypatch.setattr('extractors.mircrew_extractor.COOKIE_FILE', str(tmp_path / "mircrew_cookies.pkl"))
+    monkeypatch.setattr('extractors.mircrew_extractor.CACHE_FILE', str(tmp_path / "mircrew_cache.yml"))
+
+
 def test_episode_pattern_matching(mock_torrent_client):
     """Test the enhanced episode pattern matching with comprehensive test cases"""
     from bs4 import BeautifulSoup
@@ -114,7 +126,16 @@ def test_episode_pattern_matching(mock_torrent_client):
         # 11. Ordinal season with episode (alternative format)
         ("3rd Season Episode 12", "S03E12"),
         # 12. Season episode with metadata cleanup
-        ("Series Name S2E15 of 20 [Multi-Subs] (2023)", "S02E15")
+        ("Series Name S2E15 of 20 [Multi-Subs] (2023)", "S02E15"),
+        # 13. Most specific pattern wins even when a broader one appears first
+        ("Show - Stagione 2 - S02E05", "S02E05"),
+        ("Show Ep 3 - Stagione 2", "S02E00"),
+        # 14. A broader pattern never hides an overlapping, more specific match
+        ("Stagione 5 Ep 5x04", "S05E04"),
+        ("Stagione 2 - Episodio 2x03", "S02E03"),
+        ("Episodio 1x05", "S01E05"),
+        ("Ep.2x03", "S02E03"),
+        ("Stagione 1x05", "S01E05"),
     ]
 
     for i, (test_input, expected) in enumerate(test_cases, 1):
@@ -142,6 +163,36 @@ def test_episode_pattern_multilevel_context(mock_torrent_client):
     magnet_link = soup.find('a')
     result = extractor.extract_episode_info(magnet_link)
     assert result == "S05E04", f"Multi-level context analysis failed: got '{result}', expected 'S05E04'"
+
+
+def test_episode_info_uses_nearest_context_within_post(mock_torrent_client):
+    """Test that each magnet takes its nearest context and never reads past its post"""
+    from bs4 import BeautifulSoup
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    html = '''
+    <div class="post"><div class="postbody">
+        <p>Show S1E01 <a href="magnet:?xt=urn:btih:a">Download</a></p>
+        <p>Show S1E02 <a href="magnet:?xt=urn:btih:b">Download</a></p>
+    </div></div>
+    <div class="post">Show Stagione 1<div class="postbody"><p><a href="magnet:?xt=urn:btih:c">Pack</a></p></div></div>
+    '''
+    soup = BeautifulSoup(html, 'html.parser')
+    results = [extractor.extract_episode_info(link) for link in soup.find_all('a')]
+    assert results == ["S01E01", "S01E02", "Unknown"]
+
+
+def test_parse_needed_episodes_ranges(mock_torrent_client):
+    """Test that Sonarr episode paths expand single episodes and ranges in both formats"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    assert extractor.parse_needed_episodes('/tv/Show/Show - S01E01-E03.mkv') == {"S01E01", "S01E02", "S01E03"}
+    assert extractor.parse_needed_episodes('/tv/Show/Show 2x09.mkv') == {"S02E09"}
+    assert extractor.parse_needed_episodes('/tv/Show/Show 2x09-10.mkv') == {"S02E09", "S02E10"}
+    assert extractor.parse_needed_episodes('/tv/Show/Specials') == set()
+
+
 def test_magnet_regex_pattern(mock_torrent_client, mocker):
     """Test the improved magnet link regex pattern with real-world examples"""
     extractor = MIRCrewExtractor(mock_torrent_client)
@@ -204,6 +255,59 @@ def test_magnet_regex_pattern(mock_torrent_client, mocker):
         assert len(magnets) == 0, f"Should not have extracted invalid magnet: {invalid_magnet}"
 
 
+def test_response_html_defaults_to_utf8(mocker):
+    """Test that pages without a declared charset are decoded as UTF-8 without sniffing"""
+    from extractors.mircrew_extractor import _response_html
+
+    def html_response(content_type):
+        # Built like requests' adapter does, which picks ISO-8859-1 for text/html without a charset
+        response = requests.models.Response()
+        response.headers['Content-Type'] = content_type
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response._content = 'Stagione 1 – Episodio 2'.encode('utf-8')
+        return response
+
+    sniff = mocker.patch.object(requests.models.Response, 'apparent_encoding', new_callable=mocker.PropertyMock)
+
+    response = html_response('text/html')
+    assert response.encoding == 'ISO-8859-1'
+    assert _response_html(response) == 'Stagione 1 – Episodio 2'
+    assert response.encoding == 'utf-8'
+    sniff.assert_not_called()
+
+    # A declared charset is left alone
+    response = html_response('text/html; charset=ISO-8859-1')
+    _response_html(response)
+    assert response.encoding == 'ISO-8859-1'
+
+
+def test_page_without_magnets_is_not_parsed(mock_torrent_client, mocker):
+    """Test that a page with no magnet in its HTML returns before building a soup"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mock_response = mocker.MagicMock()
+    mock_response.text = '<html><body><p>No magnets here</p></body></html>'
+    mocker.patch.object(extractor.session, 'get', return_value=mock_response)
+    mock_soup = mocker.patch('extractors.mircrew_extractor.BeautifulSoup')
+
+    assert extractor._extract_magnets_from_page("http://example.com/thread") == []
+    mock_soup.assert_not_called()
+
+
+def test_page_magnets_dedup_by_info_hash(mock_torrent_client, mocker):
+    """Test that a torrent quoted again with other trackers is only listed once"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mock_response = mocker.MagicMock()
+    mock_response.text = '''<div class="postbody">
+        <a href="magnet:?xt=urn:btih:1234567890ABCDEF1234567890ABCDEF12345678&dn=Show.S01E01&tr=udp://one">S01E01</a>
+        <a href="magnet:?xt=urn:btih:1234567890abcdef1234567890abcdef12345678&dn=Show.S01E01&tr=udp://two">S01E01</a>
+        <a href="magnet:?xt=urn:btih:abcdef1234567890abcdef1234567890abcdef12&dn=Show.S01E02">S01E02</a>
+    </div>'''
+    mocker.patch.object(extractor.session, 'get', return_value=mock_response)
+
+    magnets = extractor._extract_magnets_from_page("http://example.com/thread")
+    assert [m['magnet_title'] for m in magnets] == ['Show.S01E01', 'Show.S01E02']
+
+
 def test_fallback_mechanism(mock_torrent_client, mocker):
     """Test the fallback mechanism in magnet extraction"""
     extractor = MIRCrewExtractor(mock_torrent_client)
@@ -323,12 +427,31 @@ def test_metadata_handling(mock_torrent_client, mocker):
     assert magnets == []
 
 
+def test_fallback_post_fetched_only_when_thread_has_none(mock_torrent_client, mocker):
+    """Test that the forum post page costs a request only when the thread page has no magnets"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    thread_magnets = [{'magnet': 'magnet:?xt=urn:btih:thread', 'episode_info': 'S01E01', 'magnet_title': 'Thread'}]
+    post_magnets = [{'magnet': 'magnet:?xt=urn:btih:post', 'episode_info': 'S01E01', 'magnet_title': 'Post'}]
+    pages = {"http://example.com/thread": thread_magnets, "http://example.com/post": post_magnets}
+    mock_page = mocker.patch.object(extractor, '_extract_magnets_from_page', side_effect=lambda url: pages[url])
+
+    assert extractor.extract_magnets_from_thread("http://example.com/thread", "http://example.com/post") == thread_magnets
+    mock_page.assert_called_once_with("http://example.com/thread")
+
+    pages["http://example.com/thread"] = []
+    assert extractor.extract_magnets_from_thread("http://example.com/thread", "http://example.com/post") == post_magnets
+    mock_page.assert_called_with("http://example.com/post")
+
+
 def test_extraction_retry_logic(mock_torrent_client, mocker):
-    """Test retry logic in magnet extraction"""
+    """Test that magnet extraction leaves retries to the session adapter"""
     extractor = MIRCrewExtractor(mock_torrent_client)
 
-    # Mock time.sleep to speed up tests
+    # Transient failures are retried with backoff by urllib3, not by sleeping here
     mock_sleep = mocker.patch('time.sleep')
+    retry = extractor.session.get_adapter('https://mircrew-releases.org').max_retries
+    assert retry.total == 3 and 502 in retry.status_forcelist
+    assert retry.backoff_jitter > 0
 
     # Test successful extraction on first attempt
     mock_response = mocker.MagicMock()
@@ -339,35 +462,14 @@ def test_extraction_retry_logic(mock_torrent_client, mocker):
     magnets = extractor._extract_magnets_from_page("http://example.com/page")
     assert len(magnets) == 1
     assert mock_get.call_count == 1
-    mock_sleep.assert_not_called()
 
-    # Test retry on HTTP error
-    call_count = 0
-    def error_then_success(url, timeout=None):
-        nonlocal call_count
-        call_count += 1
-        if call_count < 3:
-            raise requests.exceptions.RequestException("Temporary error")
-        mock_resp = mocker.MagicMock()
-        mock_resp.text = '<html><body><a href="magnet:?xt=urn:btih:abcdef123456789012345678901234567890abcdef&dn=Retry.After.Error">Retry After Error</a></body></html>'
-        mock_resp.raise_for_status.return_value = None
-        return mock_resp
-
-    mock_get.reset_mock()  # Reset the mock call count
-    mock_get.side_effect = error_then_success
-    magnets = extractor._extract_magnets_from_page("http://example.com/page")
-    assert len(magnets) == 1
-    assert call_count == 3  # Should have retried twice before succeeding
-    assert mock_get.call_count == 3  # Should have called get 3 times
-    assert mock_sleep.call_count == 2  # Should have slept twice
-
-    # Test max retries exceeded
-    mock_get.reset_mock()  # Reset the mock call count
-    mock_sleep.reset_mock()  # Reset sleep call count
+    # An error that survived the adapter's retries is final for the page
+    mock_get.reset_mock()
     mock_get.side_effect = requests.exceptions.RequestException("Persistent error")
     magnets = extractor._extract_magnets_from_page("http://example.com/page")
     assert magnets == []
-    assert mock_get.call_count == 3  # Max retries (default 3)
+    assert mock_get.call_count == 1
+    mock_sleep.assert_not_called()
 
 def test_season_search_extraction(mock_torrent_client):
     """Test the enhanced season search query extraction with comprehensive cases"""
@@ -531,6 +633,24 @@ def test_legacy_extraction_magnet_discovery(mock_torrent_client, mocker):
     assert any("general789" in url for url in magnet_urls)
 
 
+def test_legacy_extraction_dedups_by_info_hash(mock_torrent_client, mocker):
+    """Test that legacy extraction lists a torrent once even when reposted with other trackers"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    test_html = '''
+    <div class="postbody">
+        <a href="magnet:?xt=urn:btih:ABCDEF0123456789&dn=Show.S01E01&tr=udp://one">Show S01E01</a>
+        <a href="magnet:?xt=urn:btih:abcdef0123456789&dn=Show.S01E01&tr=udp://two">Show S01E01 mirror</a>
+        <a href="magnet:?xt=urn:btih:fedcba9876543210&dn=Show.S01E02">Show S01E02</a>
+    </div>
+    '''
+    mocker.patch.object(extractor.session, 'get', return_value=mocker.MagicMock(text=test_html))
+
+    result = extractor._extract_magnets_legacy_mode("http://example.com/thread")
+
+    assert [m['magnet_title'] for m in result] == ['Show.S01E01', 'Show.S01E02']
+    assert 'tr=udp://one' in result[0]['magnet']
+
+
 def test_legacy_extraction_text_pattern_fallback(mock_torrent_client, mocker):
     """Test legacy extraction's text-based pattern fallback"""
     extractor = MIRCrewExtractor(mock_torrent_client)
@@ -686,7 +806,8 @@ def test_cache_operations_basic(mock_torrent_client, tmp_path, mocker):
     assert extractor.get_cached_thread_id('Breaking Bad', '2') == '22222'
     assert extractor.get_cached_thread_id('The Office', '1') == '33333'
 
-    # Verify persistence - create new instance
+    # Verify persistence - flush pending writes, then create new instance
+    extractor.flush_cache()
     extractor2 = MIRCrewExtractor(mock_torrent_client)
     extractor2.cache_file = str(cache_file)
     extractor2.load_cache()
@@ -694,6 +815,236 @@ def test_cache_operations_basic(mock_torrent_client, tmp_path, mocker):
     assert extractor2.get_cached_thread_id('Breaking Bad', '1') == '11111'
 
 
+def test_cache_writes_are_batched(mock_torrent_client, tmp_path, mocker):
+    """Test that cache inserts are written in batches instead of on every insert"""
+    cache_file = tmp_path / "batched_cache.yml"
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.cache_file = str(cache_file)
+    extractor.thread_id_cache = {}
+    mock_save = mocker.spy(extractor, 'save_cache')
+
+    for season in range(1, CACHE_FLUSH_BATCH):
+        extractor.cache_thread_id('Batch Series', str(season), str(season))
+    mock_save.assert_not_called()
+
+    # The batch limit triggers a single write
+    extractor.cache_thread_id('Batch Series', str(CACHE_FLUSH_BATCH), '99')
+    assert mock_save.call_count == 1
+    assert cache_file.exists()
+
+    # Nothing pending, so an explicit flush does not write again
+    extractor.flush_cache()
+    assert mock_save.call_count == 1
+
+
+def test_is_already_logged_in(mock_torrent_client, mocker):
+    """Test the login status check: cookies first, then the login page status, then the UCP page"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.session.cookies.clear()
+    mock_head = mocker.patch.object(extractor.session, 'head')
+    mock_get = mocker.patch.object(extractor.session, 'get')
+
+    # No cookies means no session, so nothing is requested
+    assert extractor.is_already_logged_in() is False
+    mock_head.assert_not_called()
+    mock_get.assert_not_called()
+
+    # A decisive login page status answers without fetching any page content
+    extractor.session.cookies.set('phpbb3_sid', 'abc', domain='mircrew-releases.org')
+    mock_head.return_value = mocker.MagicMock(status_code=302, headers={'Location': './index.php?sid=abc'})
+    assert extractor.is_already_logged_in() is True
+    mock_head.return_value = mocker.MagicMock(status_code=200, headers={})
+    assert extractor.is_already_logged_in() is False
+    mock_get.assert_not_called()
+
+    # An inconclusive status falls back to the members-only UCP page
+    mock_head.return_value = mocker.MagicMock(status_code=405, headers={})
+    mock_get.return_value = mocker.MagicMock(status_code=302, headers={'Location': './ucp.php?mode=login'})
+    assert extractor.is_already_logged_in() is False
+
+    mock_get.return_value = mocker.MagicMock(status_code=200, headers={},
+                                             text='<form action="./ucp.php?mode=login" id="login"></form>')
+    assert extractor.is_already_logged_in() is False
+
+    mock_get.return_value = mocker.MagicMock(status_code=200, headers={},
+                                             text='<a href="./ucp.php?mode=logout&amp;sid=abc">Esci</a>')
+    assert extractor.is_already_logged_in() is True
+
+    # phpBB's guest user cookie means the session is gone, so nothing is requested
+    mock_head.reset_mock()
+    mock_get.reset_mock()
+    extractor.session.cookies.set('phpbb3_u', '1', domain='mircrew-releases.org')
+    assert extractor.is_already_logged_in() is False
+    assert extractor.verify_session() is False
+    mock_head.assert_not_called()
+    mock_get.assert_not_called()
+
+
+def test_login_submits_login_form(mock_torrent_client, tmp_path, mocker):
+    """Test that login reads only the login form and posts its fields with the credentials"""
+    mocker.patch('extractors.mircrew_extractor.COOKIE_FILE', str(tmp_path / "cookies.pkl"))
+    mocker.patch('extractors.mircrew_extractor.MIRCREW_USERNAME', 'tester')
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mocker.patch.object(extractor, 'is_already_logged_in', return_value=False)
+    mocker.patch.object(extractor, 'checkpoint')
+    login_page = mocker.MagicMock(text='''<html><body>
+        <form id="search" action="./search.php"><input name="keywords" value="x"></form>
+        <form id="login" action="./ucp.php?mode=login">
+            <input type="hidden" name="form_token" value="tok">
+            <input type="checkbox" name="autologin" checked>
+            <input type="checkbox" name="viewonline">
+        </form>
+    </body></html>''')
+    mocker.patch.object(extractor.session, 'get', return_value=login_page)
+    mock_post = mocker.patch.object(extractor.session, 'post', return_value=mocker.MagicMock(
+        status_code=200, url='https://mircrew-releases.org/index.php',
+        text='<a href="./ucp.php?mode=logout&amp;sid=abc">Esci</a>'))
+
+    assert extractor.login() is True
+
+    args, kwargs = mock_post.call_args
+    assert args[0] == 'https://mircrew-releases.org/ucp.php?mode=login'
+    assert kwargs['data']['form_token'] == 'tok'
+    assert kwargs['data']['autologin'] == 'on'
+    assert 'viewonline' not in kwargs['data'] and 'keywords' not in kwargs['data']
+    assert kwargs['data']['username'] == 'tester'
+
+
+def test_login_ignores_empty_username(mock_torrent_client, mocker):
+    """Test that an empty username is not taken as a logged-in indicator on every page"""
+    mocker.patch('extractors.mircrew_extractor.MIRCREW_USERNAME', '')
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    assert extractor._username_re is None
+    mocker.patch.object(extractor, 'is_already_logged_in', return_value=False)
+    mocker.patch.object(extractor.session, 'get', return_value=mocker.MagicMock(
+        text='<form id="login" action="./ucp.php?mode=login"></form>'))
+    mocker.patch.object(extractor.session, 'post', return_value=mocker.MagicMock(
+        status_code=200, url='https://mircrew-releases.org/index.php', text='<div>Forum index</div>'))
+
+    assert extractor.login(retries=1) is False
+
+
+def test_verify_session_uses_login_page_status(mock_torrent_client, mocker):
+    """Test that session verification relies on the login page status, not its HTML"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.session.cookies.set('phpbb3_sid', 'abc', domain='mircrew-releases.org')
+    mock_head = mocker.patch.object(extractor.session, 'head')
+    mock_fallback = mocker.patch.object(extractor, '_ucp_page_status', return_value=True)
+
+    mock_head.return_value = mocker.MagicMock(status_code=302, headers={'Location': './index.php?sid=abc'})
+    assert extractor.verify_session() is True
+
+    # A recently verified session is trusted without another request
+    mock_head.return_value = mocker.MagicMock(status_code=302, headers={'Location': './ucp.php?mode=login'})
+    assert extractor.verify_session() is True
+    assert mock_head.call_count == 1
+
+    extractor._session_verified_at -= SESSION_VERIFY_TTL
+    assert extractor.verify_session() is False
+
+    mock_head.return_value = mocker.MagicMock(status_code=200, headers={})
+    assert extractor.verify_session() is False
+    mock_fallback.assert_not_called()
+
+    # Anything else falls back to checking page content
+    mock_head.return_value = mocker.MagicMock(status_code=405, headers={})
+    assert extractor.verify_session() is True
+    mock_fallback.assert_called_once()
+
+
+def test_search_served_login_form_resets_session_check(mock_torrent_client, mocker):
+    """Test that a search answered with the login form makes the next session check hit the forum"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor._session_verified_at = time.monotonic()
+    mocker.patch.object(extractor.session, 'get', return_value=mocker.MagicMock(
+        status_code=200, text='<form action="./ucp.php?mode=login" id="login"></form>'))
+
+    assert extractor._search_forum('query') is None
+    assert extractor._session_verified_at is None
+
+
+def test_save_cookies_skips_unchanged_jar(mock_torrent_client, tmp_path, mocker):
+    """Test that cookies are only written when the cookie jar changed"""
+    import pickle
+    cookie_file = tmp_path / "cookies.pkl"
+    mocker.patch('extractors.mircrew_extractor.COOKIE_FILE', str(cookie_file))
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.session.cookies.set('phpbb3_sid', 'abc', domain='mircrew-releases.org')
+    mock_dump = mocker.spy(pickle, 'dump')
+
+    extractor.save_cookies()
+    extractor.save_cookies()
+    assert mock_dump.call_count == 1
+    assert cookie_file.exists()
+
+    extractor.session.cookies.set('phpbb3_sid', 'def', domain='mircrew-releases.org')
+    extractor.save_cookies()
+    assert mock_dump.call_count == 2
+
+
+def test_corrupt_cookie_file_is_discarded(mock_torrent_client, tmp_path, mocker):
+    """Test that an unreadable cookie jar is dropped instead of breaking startup"""
+    cookie_file = tmp_path / "cookies.pkl"
+    cookie_file.write_bytes(b'\x80\x05truncated')
+    mocker.patch('extractors.mircrew_extractor.COOKIE_FILE', str(cookie_file))
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    assert not extractor.session.cookies
+    assert not cookie_file.exists()
+
+
+def test_cache_evicts_oldest_entries(mock_torrent_client, tmp_path):
+    """Test that a full cache evicts its oldest entries and keeps re-cached ones"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.cache_file = str(tmp_path / "eviction_cache.yml")
+    extractor.thread_id_cache = {}
+    extractor.cache_max_size = 10
+
+    for season in range(1, 10):
+        extractor.cache_thread_id('Evict Series', str(season), str(season))
+    # Re-caching season 1 makes it the newest entry
+    extractor.cache_thread_id('Evict Series', '1', '100')
+    extractor.cache_thread_id('Evict Series', '10', '10')
+    assert len(extractor.thread_id_cache) == 10
+
+    # Reaching the limit keeps the 8 most recent entries plus the new one
+    extractor.cache_thread_id('Evict Series', '11', '11')
+    assert len(extractor.thread_id_cache) == 9
+    assert extractor.get_cached_thread_id('Evict Series', '2') is None
+    assert extractor.get_cached_thread_id('Evict Series', '3') is None
+    assert extractor.get_cached_thread_id('Evict Series', '1') == '100'
+    assert extractor.get_cached_thread_id('Evict Series', '11') == '11'
+
+
+def test_cache_entry_epoch_timestamps(mock_torrent_client, tmp_path):
+    """Test that cache entries carry epoch timestamps used for expiry checks"""
+    import yaml
+    cache_file = tmp_path / "ts_cache.yml"
+    with open(cache_file, 'w', encoding='utf-8') as f:
+        yaml.dump({'thread_cache': {
+            'Old Format S01': {'thread_id': '1', 'timestamp': '2020-01-01T00:00:00'},
+            'Recent S01': {'thread_id': '2', 'timestamp': '2020-01-01T00:00:00', 'ts': time.time()},
+        }}, f)
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    extractor.cache_file = str(cache_file)
+    extractor.load_cache()
+
+    # Entries without 'ts' get it from their ISO timestamp on load
+    assert extractor.thread_id_cache['Old Format S01']['ts'] == datetime(2020, 1, 1).timestamp()
+    assert extractor.get_cached_thread_id('Old Format', '1') is None
+    # Dropping the expired entry is a change the next flush has to write
+    assert extractor._cache_dirty == 1
+    # Expiry goes by 'ts' when present
+    assert extractor.get_cached_thread_id('Recent', '1') == '2'
+
+    extractor.cache_thread_id('New Series', '1', '3')
+    assert 'ts' in extractor.thread_id_cache['New Series S01']
+
+
 def test_cache_invalid_inputs(mock_torrent_client, tmp_path, mocker):
     """Test cache behavior with invalid inputs"""
     # Use a fresh cache file to avoid contamination from other tests
@@ -764,6 +1115,102 @@ def test_search_thread_cache_hit(mock_torrent_client, mocker):
     mock_perform_search.assert_not_called()
 
 
+def test_search_with_metadata_prefers_strategy_order(mock_torrent_client, mocker):
+    """Test that concurrent strategy searches still return the highest-priority match"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mocker.patch.object(extractor, 'verify_session', return_value=True)
+
+    def fake_search(encoded_query):
+        query = unquote_plus(encoded_query).strip('"')
+        if query == 'Show Stagione 1 Episodio 2':
+            return 'https://mircrew-releases.org/viewtopic.php?f=51&t=2'
+        if query == 'Show S01E02':
+            return 'https://mircrew-releases.org/viewtopic.php?f=51&t=1'
+        return None
+
+    mock_search = mocker.patch.object(extractor, '_perform_search', side_effect=fake_search)
+
+    result = extractor.search_thread_by_release_title_with_metadata(
+        'Show.S01E02.1080p.WEB-DL-GRP.mkv', series_title='Show', season='1', episode='2')
+
+    # The exact title strategy misses, series_season_ep beats the Italian format
+    assert result == 'https://mircrew-releases.org/viewtopic.php?f=51&t=1'
+    assert mock_search.call_count >= 2
+
+
+def test_enhanced_search_queries_are_deduplicated(mock_torrent_client, mocker):
+    """Test that overlapping search strategies produce each query only once"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mocker.patch.object(extractor, '_extract_enhanced_search_queries',
+                        return_value=[('series_season_ep', 'show s01e02'), ('series_only', 'Show')])
+
+    queries = extractor._build_enhanced_search_queries('Show S01E02', series_title='Show', season='1', episode='2')
+
+    assert queries == [
+        ('exact_title', 'Show S01E02'),
+        ('series_season_ep_it', 'Show Stagione 1 Episodio 2'),
+        ('metadata_series_only', 'Show'),
+    ]
+
+
+def test_search_by_release_title_skips_fallbacks_after_hit(mock_torrent_client, mocker):
+    """Test that an exact title hit does not send the generic fallback searches"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mocker.patch.object(extractor, 'verify_session', return_value=True)
+    mocker.patch.object(extractor, '_extract_enhanced_search_queries',
+                        return_value=[('series_episode', 'Show S01E01'), ('base_series', 'Show')])
+    mocker.patch.object(extractor, '_extract_season_search_query', return_value='Show Stagione 1')
+    thread_url = 'https://mircrew-releases.org/viewtopic.php?f=51&t=1'
+    mock_search = mocker.patch.object(
+        extractor, '_perform_search',
+        side_effect=lambda encoded_query: thread_url if 'WEB' in unquote_plus(encoded_query) else None)
+
+    assert extractor.search_thread_by_release_title('Show.S01E01.WEB-DL') == thread_url
+
+    searched = [unquote_plus(call.args[0]).strip('"') for call in mock_search.call_args_list]
+    assert 'Show.S01E01.WEB-DL' in searched
+    assert len(searched) <= 1 + SEARCH_PREFETCH
+    assert 'Show' not in searched and 'Show Stagione 1' not in searched
+
+
+def test_search_strategies_stop_after_hit(mock_torrent_client, mocker):
+    """Test that an early hit leaves later strategies unsent beyond the prefetch window"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    thread_url = 'https://mircrew-releases.org/viewtopic.php?f=51&t=1'
+    mock_search = mocker.patch.object(extractor, '_perform_search',
+                                      side_effect=lambda encoded_query: thread_url if 'First' in encoded_query else None)
+
+    strategies = [('first', 'First'), ('second', 'Second'), ('third', 'Third'), ('fourth', 'Fourth')]
+    assert extractor._run_search_strategies(strategies) == thread_url
+
+    searched = [unquote_plus(call.args[0]).strip('"') for call in mock_search.call_args_list]
+    assert 'First' in searched
+    assert len(searched) <= 1 + SEARCH_PREFETCH
+    assert 'Third' not in searched and 'Fourth' not in searched
+
+
+def test_search_by_release_title_single_pass(mock_torrent_client, mocker):
+    """Test that release title strategies never repeat a query and the earliest hit wins"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mocker.patch.object(extractor, 'verify_session', return_value=True)
+    mocker.patch.object(extractor, '_extract_enhanced_search_queries',
+                        return_value=[('base_series', 'Show'), ('exact', 'show s01e01 ')])
+    mocker.patch.object(extractor, '_extract_season_search_query', return_value='Show')
+    mock_search = mocker.patch.object(extractor, '_perform_search', return_value=None)
+
+    assert extractor.search_thread_by_release_title('Show S01E01') is None
+
+    # A prefetched search may complete out of order, so only the set of queries is deterministic
+    searched = [unquote_plus(call.args[0]).strip('"') for call in mock_search.call_args_list]
+    assert sorted(searched) == ['Show', 'Show S01E01']
+
+    # A faster generic hit does not beat the exact title
+    urls = {'Show S01E01': 'https://mircrew-releases.org/viewtopic.php?f=51&t=1',
+            'Show': 'https://mircrew-releases.org/viewtopic.php?f=51&t=2'}
+    mock_search.side_effect = lambda encoded_query: urls[unquote_plus(encoded_query).strip('"')]
+    assert extractor.search_thread_by_release_title('Show S01E01') == urls['Show S01E01']
+
+
 def test_search_thread_cache_miss(mock_torrent_client, tmp_path, mocker):
     """Test search_thread with cache miss - should perform search and cache result"""
     cache_file = tmp_path / "cache_miss_test.yml"
@@ -879,6 +1326,80 @@ def test_metadata_extraction_for_cache(mock_torrent_client):
         assert result == expected, f"Season extraction failed for '{input_title}': got '{result}', expected '{expected}'"
 
 
+def test_extract_all_meta_priorities(mock_torrent_client):
+    """Test that resolution, codec, year and season each follow their pattern priority"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    meta = extractor._extract_all_meta('Show 2019 Stagione 2 S03E01 480p 1080p x265 XviD')
+    assert meta == {'resolution': '1080p', 'codec': 'x265', 'year': '2019', 'season': '03'}
+
+    assert extractor._extract_all_meta('Show - 2nd Season') == {
+        'resolution': None, 'codec': None, 'year': None, 'season': '2'
+    }
+    assert extractor._extract_resolution('Show 720p') == '720p'
+    assert extractor._extract_codec('Show HEVC') == 'HEVC'
+    assert extractor._extract_year('Show 1998') == '1998'
+
+
+def test_extract_all_meta_overlapping_patterns(mock_torrent_client):
+    """Test that a match for one pattern does not hide an overlapping higher-priority one"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    # "Season 720" outranks "2nd Season" although the latter starts first
+    assert extractor._extract_all_meta('2nd Season 720p XviD') == {
+        'resolution': '720p', 'codec': 'XviD', 'year': None, 'season': '720'
+    }
+
+
+def test_release_title_parsing_is_memoized(mock_torrent_client):
+    """Test that a release title is parsed once and callers get their own copy of the metadata"""
+    from extractors.mircrew_extractor import _parse_release_meta, _parse_base_series_name
+
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    title = 'Memo Show - S02E03 (2021) 720p HEVC'
+    _parse_release_meta.cache_clear()
+    _parse_base_series_name.cache_clear()
+
+    meta = extractor._extract_all_meta(title)
+    meta['codec'] = 'changed'
+    assert extractor._extract_codec(title) == 'HEVC'
+    assert extractor._extract_season_number(title) == '02'
+    assert _parse_release_meta.cache_info().misses == 1
+
+    assert extractor._extract_base_series_name(title) == 'Memo Show'
+    assert extractor._extract_season_search_query(title) == 'Memo Show - Stagione 02'
+    assert _parse_base_series_name.cache_info().misses == 1
+
+
+def test_magnet_title_extraction():
+    """Test extracting the display name from magnet links"""
+    test_cases = [
+        ('magnet:?xt=urn:btih:abc&dn=Show.S01E01.1080p.mkv&tr=udp%3A%2F%2Ftracker', 'Show.S01E01.1080p'),
+        ('magnet:?xt=urn:btih:abc&dn=Show+S01E02%20ITA.mp4', 'Show S01E02 ITA'),
+        ('magnet:?dn=Show.S01E03.AVI', 'Show.S01E03'),
+        ('magnet:?xt=urn:btih:abc&dn=&tr=x', ''),
+        ('magnet:?xt=urn:btih:abc', ''),
+    ]
+
+    for magnet_url, expected in test_cases:
+        assert extract_magnet_title_from_url(magnet_url) == expected
+
+
+def test_clean_release_title_for_search(mock_torrent_client):
+    """Test stripping extension, quality tags and release group from release titles"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+
+    test_cases = [
+        ('Show S01E02 720p HDTV x264-LOL', 'Show S01E02 x264'),
+        ('Show.S01E01.1080p.WEB-DL-GRP.mkv', 'Show.S01E01..'),
+        ('Il Trono di Spade 8x01 ITA ENG 1080p BluRay-MIRCrew', 'Il Trono di Spade 8x01 ITA ENG'),
+        ('Show - S01E01 - Title', 'Show - S01E01 - Title'),
+    ]
+
+    for release_title, expected in test_cases:
+        assert extractor._clean_release_title_for_search(release_title) == expected
+
+
 def test_thread_url_extraction(mock_torrent_client):
     """Test thread ID extraction from URLs"""
     extractor = MIRCrewExtractor(mock_torrent_client)
@@ -887,6 +1408,7 @@ def test_thread_url_extraction(mock_torrent_client):
         ('https://mircrew-releases.org/viewtopic.php?f=52&t=12345', '12345'),
         ('viewtopic.php?f=52&t=67890', '67890'),
         ('t=11111', '11111'),
+        ('search.php?sk=t&st=0&t=22222', '22222'),
         ('invalid_url', None),
         ('', None),
         (None, None),
@@ -934,7 +1456,45 @@ def test_cache_thread_by_id_method(mock_torrent_client, mocker):
     result = extractor.search_thread_by_id('99999')
 
     assert result == 'https://mircrew-releases.org/viewtopic.php?f=51&t=99999'
-    mock_get.assert_called_once_with('https://mircrew-releases.org/viewtopic.php?f=51&t=99999', timeout=30)
+    mock_get.assert_called_once_with('https://mircrew-releases.org/viewtopic.php?f=51&t=99999', timeout=REQUEST_TIMEOUT)
+
+    # A thread verified once is not requested again
+    assert extractor.search_thread_by_id('99999') == result
+    mock_get.assert_called_once()
+
+    # Once the verification is older than THREAD_VERIFY_TTL the thread is checked again
+    extractor._verified_thread_ids['99999'] -= THREAD_VERIFY_TTL
+    assert extractor.search_thread_by_id('99999') == result
+    assert mock_get.call_count == 2
+
+
+def test_search_forum_parses_topic_list(mock_torrent_client, mocker):
+    """Test that forum search results are read from the ul.topiclist.topics list"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    mock_response = mocker.MagicMock()
+    mock_response.text = '''<html><body>
+        <ul class="topiclist"><li class="header"><a href="./viewtopic.php?f=1&amp;t=1">Header</a></li></ul>
+        <ul class="topiclist topics">
+            <li class="row"><a class="topictitle" href="./viewtopic.php?f=51&amp;t=4242">Show S01</a></li>
+            <li class="row"><a class="topictitle" href="./viewtopic.php?f=51&amp;t=4343">Show S02</a></li>
+        </ul>
+    </body></html>'''
+    mocker.patch.object(extractor.session, 'get', return_value=mock_response)
+
+    assert extractor._search_forum('%22Show%22') == 'https://mircrew-releases.org/viewtopic.php?f=51&t=4242'
+
+
+def test_perform_search_reuses_recent_results(mock_torrent_client, mocker):
+    """Test that repeated searches for the same query reuse the previous result"""
+    extractor = MIRCrewExtractor(mock_torrent_client)
+    thread_url = 'https://mircrew-releases.org/viewtopic.php?f=51&t=12345'
+    mock_search = mocker.patch.object(extractor, '_search_forum', side_effect=[None, thread_url])
+
+    # Misses are not cached, successes are
+    assert extractor._perform_search('%22Show%22') is None
+    assert extractor._perform_search('%22Show%22') == thread_url
+    assert extractor._perform_search('%22Show%22') == thread_url
+    assert mock_search.call_count == 2
 
 
 def test_cache_thread_by_id_invalid(mock_torrent_client, mocker):
@@ -1109,4 +1669,48 @@ def test_cache_error_recovery(mock_torrent_client, tmp_path, mocker):
     assert extractor.get_cached_thread_id('Error Test', '1') == '123'
 
     # Should still have entry in memory
-    assert extractor.get_cached_thread_id('Error Test', '1') == '123'
\ No newline at end of file
+    assert extractor.get_cached_thread_id('Error Test', '1') == '123'
+
+
+@pytest.fixture
+def fresh_extractor_factory(mocker):
+    """Forum extractor factory with an empty instance cache, cleared again afterwards"""
+    from extractors import forum_extractor_factory
+
+    mocker.patch.object(forum_extractor_factory.atexit, 'register')
+    forum_extractor_factory._create_cached_forum_extractor.cache_clear()
+    yield forum_extractor_factory
+    forum_extractor_factory._create_cached_forum_extractor.cache_clear()
+
+
+def test_forum_extractor_factory_caches_instances(mock_torrent_client, fresh_extractor_factory, mocker):
+    """Test that the factory reuses the extractor for the same forum type"""
+    mock_create = mocker.patch.object(fresh_extractor_factory, '_create_mircrew_extractor',
+                                      side_effect=lambda: MIRCrewExtractor(mock_torrent_client))
+
+    first = fresh_extractor_factory.create_forum_extractor('mircrew')
+    second = fresh_extractor_factory.create_forum_extractor('MIRCrew')
+
+    assert first is second
+    assert mock_create.call_count == 1
+
+
+def test_forum_extractor_factory_registers_close_at_exit(mock_torrent_client, fresh_extractor_factory, mocker):
+    """Test that the cached extractor is closed at exit, whoever created it"""
+    mocker.patch.object(fresh_extractor_factory, '_create_mircrew_extractor',
+                        side_effect=lambda: MIRCrewExtractor(mock_torrent_client))
+
+    extractor = fresh_extractor_factory.create_forum_extractor('mircrew')
+    fresh_extractor_factory.create_forum_extractor('mircrew')
+
+    fresh_extractor_factory.atexit.register.assert_called_once_with(extractor.close)
+
+
+def test_close_flushes_pending_cache(mock_torrent_client, mocker):
+    """Test that close() persists cache entries still waiting for a batched flush"""
+    with MIRCrewExtractor(mock_torrent_client) as extractor:
+        mock_save = mocker.patch.object(extractor, 'save_cache')
+        mocker.patch.object(extractor, 'save_cookies')
+        extractor._cache_dirty = 1
+
+    mock_save.assert_called_once()
@@ -5,7 +5,7 @@ Tests for Sonarr API client
 import pytest
 import requests
 from unittest.mock import MagicMock, patch
-from api.sonarr_api import SonarrAPI, normalize_title
+from api.sonarr_api import SonarrAPI, normalize_title, RETRY_BACKOFF_MAX
 
 
 class TestNormalizeTitle:
@@ -70,6 +70,20 @@ class TestSonarrAPI:
         assert result[0]['id'] == 1
         mock_get.assert_called_once_with('http://localhost:8989/api/v3/episode', params={'seriesId': 123})
 
+    @patch('requests.Session.get')
+    def test_get_series_episodes_season(self, mock_get):
+        """Test that the season number is sent to Sonarr when given"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = []
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        api = SonarrAPI(base_url='http://localhost:8989', api_key='test-key')
+        api.get_series_episodes(123, season_number=2)
+
+        mock_get.assert_called_once_with('http://localhost:8989/api/v3/episode',
+                                         params={'seriesId': 123, 'seasonNumber': 2})
+
     def test_get_series_episodes_failure(self):
         """Test handling of API failure when getting episodes"""
         api = SonarrAPI()
@@ -78,21 +92,16 @@ class TestSonarrAPI:
             result = api.get_series_episodes(123)
             assert result == []
 
-    def test_get_series_episodes_retry_logic(self):
-        """Test retry logic on transient failures"""
-        api = SonarrAPI()
-        with patch.object(api.session, 'get') as mock_get:
-            # First two calls fail, third succeeds
-            mock_response = MagicMock()
-            mock_response.json.return_value = [{'id': 1, 'seasonNumber': 1, 'episodeNumber': 1, 'hasFile': True}]
-            mock_response.raise_for_status.return_value = None
-
-            mock_get.side_effect = [requests.exceptions.RequestException("Connection Error"), requests.exceptions.RequestException("Timeout"), mock_response]
-
-            result = api.get_series_episodes(123)
-
-            assert len(result) == 1
-            assert mock_get.call_count == 3  # Should have retried
+    def test_session_retry_adapter(self):
+        """Test that transient failures are retried by the mounted transport adapter"""
+        api = SonarrAPI(base_url='http://localhost:8989')
+        for scheme in ('http://', 'https://'):
+            retry = api.session.get_adapter(f'{scheme}localhost:8989').max_retries
+            assert retry.total == 3
+            assert 503 in retry.status_forcelist
+            assert 'GET' in retry.allowed_methods and 'POST' not in retry.allowed_methods
+            assert retry.backoff_max == RETRY_BACKOFF_MAX
+            assert retry.backoff_jitter > 0
 
     @patch('requests.Session.get')
     def test_get_series_by_title_found(self, mock_get):
@@ -167,6 +176,80 @@ class TestSonarrAPI:
             result = api.get_series_by_title('Test Series')
             assert result is None
 
+    @patch('requests.Session.get')
+    def test_get_series_by_title_uses_cache(self, mock_get):
+        """Test that repeated lookups reuse the cached series list"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [
+            {'id': 1, 'title': 'Test Series'},
+            {'id': 2, 'title': 'Another Series'}
+        ]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        api = SonarrAPI()
+        assert api.get_series_by_title('Test Series')['id'] == 1
+        assert api.get_series_by_title('another series')['id'] == 2
+        assert api.get_series_by_title('Missing Series') is None
+
+        assert mock_get.call_count == 1
+
+    @patch('requests.Session.get')
+    def test_get_series_by_title_cache_expired(self, mock_get):
+        """Test that the series list is fetched again once the TTL expires"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = [{'id': 1, 'title': 'Test Series'}]
+        mock_response.raise_for_status.return_value = None
+        mock_get.return_value = mock_response
+
+        api = SonarrAPI()
+        api.get_series_by_title('Test Series')
+        api._series_cache_ts -= api._series_ttl + 1
+        api.get_series_by_title('Test Series')
+
+        assert mock_get.call_count == 2
+
+    def test_find_matching_release_priority(self):
+        """Test that an enhanced hit returns without running the fallback searches"""
+        extractor = MagicMock()
+        extractor.search_thread_by_release_title_with_metadata.return_value = 'http://forum/enhanced'
+        extractor.search_thread_by_release_title.return_value = 'http://forum/standard'
+        extractor.search_thread.return_value = 'http://forum/cached'
+
+        api = SonarrAPI()
+        result = api.find_matching_release(extractor, 'Test Series - S01E01', series_title='Test Series', season='1')
+
+        assert result == 'http://forum/enhanced'
+        extractor.search_thread_by_release_title.assert_not_called()
+        extractor.search_thread.assert_not_called()
+
+    def test_find_matching_release_fallback(self):
+        """Test that lower priority searches are used when higher ones fail"""
+        extractor = MagicMock()
+        extractor.search_thread_by_release_title_with_metadata.side_effect = Exception("Search Error")
+        extractor.search_thread_by_release_title.return_value = None
+        extractor.search_thread.return_value = 'http://forum/cached'
+
+        api = SonarrAPI()
+        result = api.find_matching_release(extractor, 'Test Series - S01E01', series_title='Test Series')
+
+        assert result == 'http://forum/cached'
+        extractor.search_thread.assert_called_once_with('Test Series - S01E01')
+
+    def test_find_matching_release_cached(self):
+        """Test that repeated release lookups are served from the cache until invalidated"""
+        extractor = MagicMock()
+        extractor.search_thread_by_release_title_with_metadata.return_value = 'http://forum/enhanced'
+
+        api = SonarrAPI()
+        for _ in range(3):
+            assert api.find_matching_release(extractor, 'Test Series - S01E01', season='1') == 'http://forum/enhanced'
+        assert extractor.search_thread_by_release_title_with_metadata.call_count == 1
+
+        api.invalidate()
+        api.find_matching_release(extractor, 'Test Series - S01E01', season='1')
+        assert extractor.search_thread_by_release_title_with_metadata.call_count == 2
+
     @patch('api.sonarr_api.SonarrAPI.get_series_by_title')
     @patch('api.sonarr_api.SonarrAPI.get_series_episodes')
     def test_get_existing_episodes_success(self, mock_get_episodes, mock_get_series):
@@ -245,6 +328,50 @@ class TestSonarrAPI:
         assert result == expected
         # Only episodes with hasFile=True should be included
 
+        # Season index mirrors the episode codes
+        assert result.by_season == {1: frozenset({1, 3})}
+        assert result.has_episode(1, 3)
+        assert not result.has_episode(1, 2)
+        assert not result.has_episode(2, 1)
+
+    @patch('api.sonarr_api.SonarrAPI.get_series_by_title')
+    @patch('api.sonarr_api.SonarrAPI.get_series_episodes')
+    def test_get_existing_episodes_season_filter(self, mock_get_episodes, mock_get_series):
+        """Test that only the requested season is returned when season_number is given"""
+        mock_get_series.return_value = {'id': 1, 'title': 'Test Series'}
+
+        mock_get_episodes.return_value = [
+            {'seasonNumber': 1, 'episodeNumber': 1, 'hasFile': True},
+            {'seasonNumber': 2, 'episodeNumber': 1, 'hasFile': True},
+            {'seasonNumber': 2, 'episodeNumber': 2, 'hasFile': False},
+        ]
+
+        api = SonarrAPI()
+        assert api.get_existing_episodes('Test Series', season_number='2') == {'S02E01'}
+        assert api.get_existing_episodes('Test Series', season_number=1) == {'S01E01'}
+
+    @patch('api.sonarr_api.SonarrAPI.get_series_by_title')
+    @patch('api.sonarr_api.SonarrAPI.get_series_episodes')
+    def test_get_existing_episodes_missing_fields(self, mock_get_episodes, mock_get_series):
+        """Test that episodes without the usual fields are still handled"""
+        mock_get_series.return_value = {'id': 1, 'title': 'Test Series'}
+
+        mock_get_episodes.return_value = [
+            {'seasonNumber': 1, 'episodeNumber': 1},
+            {'seasonNumber': 1, 'episodeNumber': 2, 'hasFile': True},
+        ]
+
+        api = SonarrAPI()
+        assert api.get_existing_episodes('Test Series') == {'S01E02'}
+
+        # A record missing a field after complete ones must not drop the whole result
+        mock_get_episodes.return_value = [
+            {'seasonNumber': 1, 'episodeNumber': 1, 'hasFile': True},
+            {'seasonNumber': 1, 'episodeNumber': 2},
+            {'seasonNumber': 1, 'hasFile': True},
+        ]
+        assert api.get_existing_episodes('Test Series') == {'S01E01', 'S01E00'}
+
     def test_get_existing_episodes_no_api_config(self):
         """Test that empty set is returned when API is not configured"""
         api = SonarrAPI(base_url='', api_key='')
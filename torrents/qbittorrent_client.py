@@ -7,14 +7,22 @@ Concrete implementation of TorrentClient for qBittorrent WebUI.
 import requests
 import re
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Optional, List, Dict, Any
 import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from torrents.torrent_client import TorrentClient
 
 logger = logging.getLogger(__name__)
 
+# Info hashes in magnet links: 40 hex characters (SHA-1), or the shorter 32-character form
+_BTIH_40_RE = re.compile(r'urn:btih:([a-fA-F0-9]{40})')
+_BTIH_32_RE = re.compile(r'urn:btih:([a-fA-F0-9]{32})')
+
 
 class QBittorrentClient(TorrentClient):
     """
@@ -37,6 +45,14 @@ class QBittorrentClient(TorrentClient):
         self.password = password
         self.cookie = None
 
+        # One keep-alive session for all WebUI calls; only idempotent requests are retried,
+        # with a little random jitter added to each backoff
+        self.session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, backoff_jitter=0.5, status_forcelist=[500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
     def login(self) -> bool:
         """
         Login to qBittorrent WebUI.
@@ -50,7 +66,7 @@ class QBittorrentClient(TorrentClient):
                 'username': self.username,
                 'password': self.password
             }
-            resp = requests.post(login_url, data=data)
+            resp = self.session.post(login_url, data=data)
             if resp.text == "Ok.":
                 self.cookie = resp.cookies
                 logger.info("qBittorrent login successful")
@@ -80,7 +96,7 @@ class QBittorrentClient(TorrentClient):
             }
             if category:
                 data['category'] = category
-            resp = requests.post(url, data=data, cookies=self.cookie)
+            resp = self.session.post(url, data=data, cookies=self.cookie)
             return resp.status_code == 200
         except Exception as e:
             logger.error(f"Error adding magnet: {e}")
@@ -95,7 +111,7 @@ class QBittorrentClient(TorrentClient):
         """
         try:
             url = f"{self.url}/api/v2/torrents/info"
-            resp = requests.get(url, cookies=self.cookie)
+            resp = self.session.get(url, cookies=self.cookie)
             return resp.json()
         except Exception as e:
             logger.error(f"Error retrieving qBittorrent torrents: {e}")
@@ -117,7 +133,7 @@ class QBittorrentClient(TorrentClient):
                 'hashes': torrent_hash,
                 'deleteFiles': 'false'
             }
-            resp = requests.post(url, data=data, cookies=self.cookie)
+            resp = self.session.post(url, data=data, cookies=self.cookie)
             return resp.status_code == 200
         except Exception as e:
             logger.error(f"Error removing torrent: {e}")
@@ -135,12 +151,12 @@ class QBittorrentClient(TorrentClient):
         """
         try:
             # Try 40-character hash first
-            match = re.search(r'urn:btih:([a-fA-F0-9]{40})', magnet_url)
+            match = _BTIH_40_RE.search(magnet_url)
             if match:
                 return match.group(1).lower()
 
             # Try 32-character hash
-            match = re.search(r'urn:btih:([a-fA-F0-9]{32})', magnet_url)
+            match = _BTIH_32_RE.search(magnet_url)
             if match:
                 return match.group(1).lower()
 
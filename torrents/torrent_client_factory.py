@@ -7,7 +7,10 @@ Factory module for creating torrent client instances based on configuration.
 from typing import Optional
 import sys
 import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pathlib import Path
+_ROOT = str(Path(__file__).resolve().parents[1])
+if _ROOT not in sys.path:
+    sys.path.append(_ROOT)
 from torrents.torrent_client import TorrentClient
 from torrents.qbittorrent_client import QBittorrentClient
 